@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
 from app.core.deps import get_jsonplaceholder_orchestrator
 from app.orchestration.jsonplaceholder_orchestrator import JsonPlaceholderOrchestrator
@@ -7,7 +7,8 @@ router = APIRouter()
 
 
 @router.get("/posts")
-def list_posts(
+async def list_posts(
+    limit: int = Query(10, ge=1, le=100),
     orchestrator: JsonPlaceholderOrchestrator = Depends(get_jsonplaceholder_orchestrator),
 ) -> list[dict]:
-    return orchestrator.list_posts()
+    return await orchestrator.list_posts(limit=limit)
@@ -1,8 +1,16 @@
+import logging
+from typing import AsyncIterator
+
 from fastapi import APIRouter, Depends
 
-from app.api.schemas.llm import LLMConfigResponse
+from app.api.schemas.llm import ChatStreamRequest, LLMConfigResponse, LLMLimiterStatsResponse
+from app.api.streaming import EventStreamResponse, sse_event
 from app.core.deps import get_llm_orchestrator
 from app.orchestration.llm_orchestrator import LLMOrchestrator
+from app.services.conversation_store import ConversationNotFoundError
+from app.services.llm.limiting import LLMRateLimitError
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -10,3 +18,40 @@ router = APIRouter()
 @router.get("/config", response_model=LLMConfigResponse)
 def llm_config(orchestrator: LLMOrchestrator = Depends(get_llm_orchestrator)) -> LLMConfigResponse:
     return orchestrator.config()
+
+
+@router.get("/limits", response_model=list[LLMLimiterStatsResponse])
+def llm_limits(
+    orchestrator: LLMOrchestrator = Depends(get_llm_orchestrator),
+) -> list[LLMLimiterStatsResponse]:
+    return orchestrator.limiter_stats()
+
+
+@router.post("/chat/stream", response_class=EventStreamResponse)
+async def chat_stream(
+    payload: ChatStreamRequest,
+    orchestrator: LLMOrchestrator = Depends(get_llm_orchestrator),
+) -> EventStreamResponse:
+    async def events() -> AsyncIterator[str]:
+        stream = orchestrator.stream_chat(payload)
+        try:
+            async for event in stream:
+                if event.kind == "delta":
+                    yield sse_event("delta", {"text": event.text or ""})
+                elif event.kind == "done":
+                    done: dict[str, str | None] = {"response_id": event.response_id}
+                    if event.conversation_id:
+                        done["conversation_id"] = event.conversation_id
+                    yield sse_event("done", done)
+        except ConversationNotFoundError as exc:
+            yield sse_event("error", {"error": str(exc), "code": "conversation_not_found"})
+        except LLMRateLimitError as exc:
+            logger.warning("LLM stream rejected: %s", exc)
+            yield sse_event("error", {"error": str(exc), "code": "rate_limited"})
+        except Exception:
+            logger.exception("LLM stream failed")
+            yield sse_event("error", {"error": "LLM stream failed"})
+        finally:
+            await stream.aclose()
+
+    return EventStreamResponse(events())
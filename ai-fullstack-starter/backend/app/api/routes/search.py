@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, Query
 
-from app.api.schemas.search import SearchResponse
-from app.core.deps import get_search_orchestrator
+from app.api.schemas.search import CacheStatsResponse, SearchResponse
+from app.core.cache import ResponseCache
+from app.core.deps import get_search_cache, get_search_orchestrator
 from app.orchestration.search_orchestrator import SearchOrchestrator
 
 router = APIRouter()
@@ -13,3 +14,16 @@ async def wiki_search(
     orchestrator: SearchOrchestrator = Depends(get_search_orchestrator),
 ) -> SearchResponse:
     return await orchestrator.search(q)
+
+
+@router.get("/cache/stats", response_model=CacheStatsResponse)
+def cache_stats(cache: ResponseCache | None = Depends(get_search_cache)) -> CacheStatsResponse:
+    if cache is None:
+        return CacheStatsResponse(enabled=False, hits=0, misses=0, coalesced=0)
+    stats = cache.stats
+    return CacheStatsResponse(
+        enabled=True,
+        hits=stats.hits,
+        misses=stats.misses,
+        coalesced=stats.coalesced,
+    )
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+
+from app.api.schemas.search import SearchBatchRequest, SearchBatchResponse
+from app.core.config import settings
+from app.core.deps import get_search_orchestrator
+from app.orchestration.search_orchestrator import SearchOrchestrator
+
+router = APIRouter()
+
+
+@router.post("/batch", response_model=SearchBatchResponse)
+async def search_batch(
+    payload: SearchBatchRequest,
+    orchestrator: SearchOrchestrator = Depends(get_search_orchestrator),
+) -> SearchBatchResponse:
+    return await orchestrator.search_batch(
+        payload.queries, max_concurrency=settings.SEARCH_BATCH_CONCURRENCY
+    )
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, Field, model_validator
 
 
 class LLMConfigResponse(BaseModel):
@@ -6,3 +8,32 @@ class LLMConfigResponse(BaseModel):
     model: str
     has_openai_key: bool
     has_gemini_key: bool
+
+
+class LLMLimiterStatsResponse(BaseModel):
+    provider: str
+    in_flight: int
+    queued: int
+    admitted: int
+    rejected: int
+    retries: int
+    upstream_errors: int
+
+
+class ChatMessage(BaseModel):
+    role: Literal["system", "user", "assistant"]
+    content: str
+
+
+class ChatStreamRequest(BaseModel):
+    messages: list[ChatMessage] = Field(..., min_length=1)
+    model: str | None = None
+    previous_response_id: str | None = None
+    conversation_id: str | None = Field(default=None, min_length=1, max_length=128)
+    new_conversation: bool = False
+
+    @model_validator(mode="after")
+    def _one_conversation_mode(self) -> "ChatStreamRequest":
+        if self.new_conversation and self.conversation_id:
+            raise ValueError("Send either conversation_id or new_conversation, not both")
+        return self
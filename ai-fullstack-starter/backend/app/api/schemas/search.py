@@ -1,4 +1,8 @@
-from pydantic import BaseModel
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
 
 
 class SearchResult(BaseModel):
@@ -10,3 +14,26 @@ class SearchResult(BaseModel):
 class SearchResponse(BaseModel):
     query: str
     results: list[SearchResult]
+
+
+class SearchBatchRequest(BaseModel):
+    queries: list[Annotated[str, Field(min_length=2)]] = Field(
+        ..., min_length=1, max_length=settings.SEARCH_BATCH_MAX_QUERIES
+    )
+
+
+class SearchBatchItem(BaseModel):
+    query: str
+    results: list[SearchResult] = []
+    error: str | None = None
+
+
+class SearchBatchResponse(BaseModel):
+    items: list[SearchBatchItem]
+
+
+class CacheStatsResponse(BaseModel):
+    enabled: bool
+    hits: int
+    misses: int
+    coalesced: int
@@ -4,10 +4,10 @@ import httpx
 class JsonPlaceholderClient:
     base_url = "https://jsonplaceholder.typicode.com"
 
-    def list_posts(self) -> list[dict]:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(f"{self.base_url}/posts")
-            response.raise_for_status()
-            data = response.json()
+    def __init__(self, http_client: httpx.AsyncClient) -> None:
+        self.http_client = http_client
 
-        return data[:10]
+    async def list_posts(self, limit: int = 10) -> list[dict]:
+        response = await self.http_client.get(f"{self.base_url}/posts", params={"_limit": limit})
+        response.raise_for_status()
+        return response.json()
@@ -1,11 +1,17 @@
+import asyncio
+from collections.abc import Sequence
 from typing import Any
 
 import httpx
 
 
 class WikipediaClient:
+    name = "wikipedia"
     base_url = "https://en.wikipedia.org/w/api.php"
 
+    def __init__(self, http_client: httpx.AsyncClient) -> None:
+        self.http_client = http_client
+
     async def search(self, query: str) -> list[dict[str, str]]:
         params = {
             "action": "query",
@@ -14,10 +20,9 @@ class WikipediaClient:
             "srsearch": query,
             "srlimit": 5,
         }
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(self.base_url, params=params)
-            response.raise_for_status()
-            payload: dict[str, Any] = response.json()
+        response = await self.http_client.get(self.base_url, params=params)
+        response.raise_for_status()
+        payload: dict[str, Any] = response.json()
 
         items = payload.get("query", {}).get("search", [])
         return [
@@ -28,3 +33,7 @@ class WikipediaClient:
             }
             for item in items
         ]
+
+    async def search_many(self, queries: Sequence[str]) -> list[list[dict[str, str]]]:
+        # The search API takes one query per request; the pooled client multiplexes them.
+        return list(await asyncio.gather(*(self.search(query) for query in queries)))
@@ -0,0 +1,139 @@
+"""Response caching with TTL/LRU eviction, an optional Redis backend and request coalescing."""
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from app.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> Any | None:
+        ...
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        ...
+
+    async def aclose(self) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """Bounded in-process LRU where every entry also expires after its TTL."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> Any | None:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def aclose(self) -> None:
+        self._entries.clear()
+
+
+class RedisCacheBackend:
+    """Redis-backed cache storing JSON values; Redis errors are treated as misses."""
+
+    def __init__(self, url: str, prefix: str = "cache:") -> None:
+        from redis.asyncio import Redis
+
+        self._redis = Redis.from_url(url)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Any | None:
+        try:
+            raw = await self._redis.get(self.prefix + key)
+        except Exception:
+            logger.warning("Redis cache read failed for %s", key, exc_info=True)
+            return None
+        return None if raw is None else json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        try:
+            await self._redis.set(self.prefix + key, json.dumps(value), px=int(ttl_seconds * 1000))
+        except Exception:
+            logger.warning("Redis cache write failed for %s", key, exc_info=True)
+
+    async def aclose(self) -> None:
+        await self._redis.aclose()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+
+
+class ResponseCache:
+    """Caches loader results and lets concurrent callers for one key share a single load."""
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: float) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        cached = await self.backend.get(key)
+        if cached is not None:
+            self.stats.hits += 1
+            return cached
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+        else:
+            self.stats.misses += 1
+            # The load runs in its own task, so a cancelled caller does not cancel it for the
+            # other callers waiting on the same key.
+            task = asyncio.create_task(self._load(key, loader))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = await loader()
+        await self.backend.set(key, value, self.ttl_seconds)
+        return value
+
+    def _finish(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Mark it retrieved in case every caller was cancelled.
+
+    async def aclose(self) -> None:
+        await self.backend.aclose()
+
+
+def build_search_cache(settings: Settings) -> ResponseCache | None:
+    if not settings.SEARCH_CACHE_ENABLED:
+        return None
+    backend: CacheBackend
+    if settings.SEARCH_CACHE_BACKEND.strip().lower() == "redis":
+        backend = RedisCacheBackend(settings.REDIS_URL, prefix="search:")
+    else:
+        backend = MemoryCacheBackend(max_entries=settings.SEARCH_CACHE_MAX_ENTRIES)
+    return ResponseCache(backend=backend, ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS)
@@ -12,14 +12,56 @@ class Settings(BaseSettings):
     CORS_ORIGINS: str = "http://localhost:3000"
     LLM_PROVIDER: str = "openai"
     LLM_MODEL: str = ""  # Provider default: gpt-4o-mini (openai), gemini-2.0-flash-exp (gemini)
+    LLM_ROUTER_PROVIDERS: str = "openai,gemini"  # Used when LLM_PROVIDER=router, in order
+    LLM_FIRST_TOKEN_TIMEOUT_SECONDS: float = 5.0
+    LLM_HEDGE_AFTER_MS: int = 0  # 0 disables hedging
+    LLM_STREAM_COALESCE_BYTES: int = 256  # 0 sends every provider delta as-is
+    LLM_STREAM_COALESCE_MS: int = 30
+    LLM_STREAM_BUFFER_EVENTS: int = 64
+    LLM_MAX_CONCURRENT_STREAMS: int = 32  # Per provider
+    LLM_REQUESTS_PER_MINUTE: int = 0  # Per provider; 0 disables
+    LLM_TOKENS_PER_MINUTE: int = 0  # Per provider, estimated; 0 disables
+    LLM_OUTPUT_TOKENS_ESTIMATE: int = 512
+    LLM_QUEUE_MAX_WAIT_SECONDS: float = 10.0
+    LLM_MAX_RETRIES: int = 2
+    LLM_RETRY_BACKOFF_SECONDS: float = 0.5
+    LLM_CACHE_ENABLED: bool = False
+    LLM_CACHE_BACKEND: str = "memory"  # "memory" or "redis" (uses REDIS_URL)
+    LLM_CACHE_TTL_SECONDS: float = 3600.0
+    LLM_CACHE_MAX_ENTRIES: int = 512
+    LLM_CACHE_REPLAY_CHUNK_CHARS: int = 24
+    LLM_CACHE_SEMANTIC_THRESHOLD: float = 0.0  # Cosine similarity, e.g. 0.95; 0 disables
+    LLM_CACHE_EMBEDDING_MODEL: str = "text-embedding-3-small"
+    CONVERSATION_STORE_BACKEND: str = "memory"  # "memory", "redis" or "postgres" (DATABASE_URL)
+    CONVERSATION_WINDOW_ITEMS: int = 20
+    CONVERSATION_MAX_ITEMS: int = 200  # Stored turns per conversation; 0 keeps all
+    CONVERSATION_TTL_SECONDS: float = 86400.0
+    CONVERSATION_MAX_CONVERSATIONS: int = 1000
+    HTTP_TIMEOUT: float = 10.0
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP2_ENABLED: bool = True
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_BACKEND: str = "memory"  # "memory" or "redis" (uses REDIS_URL)
+    SEARCH_CACHE_TTL_SECONDS: float = 300.0
+    SEARCH_CACHE_MAX_ENTRIES: int = 1024
+    SEARCH_DEADLINE_SECONDS: float = 2.0
+    SEARCH_BATCH_MAX_QUERIES: int = 20
+    SEARCH_BATCH_CONCURRENCY: int = 4
 
     def cors_origin_list(self) -> list[str]:
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()]
 
-    def resolved_llm_model(self) -> str:
-        if self.LLM_MODEL:
+    def llm_router_provider_list(self) -> list[str]:
+        names = self.LLM_ROUTER_PROVIDERS.split(",")
+        return [name.strip().lower() for name in names if name.strip()]
+
+    def resolved_llm_model(self, provider: str | None = None) -> str:
+        active = self.LLM_PROVIDER.strip().lower()
+        provider = (provider or active).strip().lower()
+        if self.LLM_MODEL and provider == active:
             return self.LLM_MODEL
-        provider = self.LLM_PROVIDER.strip().lower()
         if provider == "gemini":
             return "gemini-2.0-flash-exp"
         return "gpt-4o-mini"
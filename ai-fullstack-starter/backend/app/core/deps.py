@@ -1,28 +1,124 @@
+"""Dependency container: app-scoped objects are built once in the lifespan and shared.
+
+Clients, services and orchestrators here hold no per-request state, so routes resolve them
+from ``app.state.container`` with a single dependency instead of rebuilding them per request.
+Request-scoped values (query params, bodies) still come from FastAPI. Tests swap parts of the
+graph with ``AppContainer.override``.
+"""
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from fastapi import Request
+
 from app.clients.jsonplaceholder_client import JsonPlaceholderClient
 from app.clients.wikipedia_client import WikipediaClient
+from app.core.cache import ResponseCache, build_search_cache
+from app.core.config import Settings
+from app.core.http_clients import HttpClientRegistry
 from app.orchestration.jsonplaceholder_orchestrator import JsonPlaceholderOrchestrator
 from app.orchestration.llm_orchestrator import LLMOrchestrator
 from app.orchestration.search_orchestrator import SearchOrchestrator
+from app.services.conversation_store import ConversationStore, build_conversation_store
 from app.services.llm_service import LLMService
 from app.services.search_service import SearchService
 
 
-def get_wikipedia_client() -> WikipediaClient:
-    return WikipediaClient()
+class AppContainer:
+    """Owns the app's resources and the objects wired from them."""
+
+    # Resources own connections; services are rebuilt from them when a resource is overridden.
+    RESOURCES = ("http_clients", "search_cache", "conversation_store")
+    SERVICES = ("search_orchestrator", "jsonplaceholder_orchestrator", "llm_orchestrator")
+
+    search_orchestrator: SearchOrchestrator
+    jsonplaceholder_orchestrator: JsonPlaceholderOrchestrator
+    llm_orchestrator: LLMOrchestrator
+
+    def __init__(
+        self,
+        settings: Settings,
+        http_clients: HttpClientRegistry,
+        search_cache: ResponseCache | None,
+        conversation_store: ConversationStore,
+    ) -> None:
+        self.settings = settings
+        self.http_clients = http_clients
+        self.search_cache = search_cache
+        self.conversation_store = conversation_store
+        self._wire()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "AppContainer":
+        return cls(
+            settings=settings,
+            http_clients=HttpClientRegistry.from_settings(settings),
+            search_cache=build_search_cache(settings),
+            conversation_store=build_conversation_store(settings),
+        )
+
+    def _wire(self) -> None:
+        wikipedia_client = WikipediaClient(http_client=self.http_clients.async_client)
+        self.search_orchestrator = SearchOrchestrator(
+            search_service=SearchService(
+                clients=[wikipedia_client],
+                cache=self.search_cache,
+                deadline_seconds=self.settings.SEARCH_DEADLINE_SECONDS,
+            )
+        )
+        self.jsonplaceholder_orchestrator = JsonPlaceholderOrchestrator(
+            client=JsonPlaceholderClient(http_client=self.http_clients.async_client)
+        )
+        self.llm_orchestrator = LLMOrchestrator(
+            llm_service=LLMService(conversation_store=self.conversation_store)
+        )
+
+    @contextmanager
+    def override(self, **replacements: Any) -> Iterator["AppContainer"]:
+        """Temporarily replace resources and/or services; dependents of a replaced resource
+        are rewired. Replaced objects are not closed."""
+        unknown = set(replacements) - set(self.RESOURCES) - set(self.SERVICES)
+        if unknown:
+            raise ValueError(f"Unknown container entries: {sorted(unknown)}")
+        previous = {name: getattr(self, name) for name in (*self.RESOURCES, *self.SERVICES)}
+        for name in self.RESOURCES:
+            if name in replacements:
+                setattr(self, name, replacements[name])
+        self._wire()
+        for name in self.SERVICES:
+            if name in replacements:
+                setattr(self, name, replacements[name])
+        try:
+            yield self
+        finally:
+            for name, value in previous.items():
+                setattr(self, name, value)
+
+    async def aclose(self) -> None:
+        await self.http_clients.aclose()
+        if self.search_cache is not None:
+            await self.search_cache.aclose()
+        await self.conversation_store.aclose()
+
+
+def get_container(request: Request) -> AppContainer:
+    container: AppContainer | None = getattr(request.app.state, "container", None)
+    if container is None:
+        raise RuntimeError("App container is not initialized; is the app lifespan running?")
+    return container
 
 
-def get_jsonplaceholder_client() -> JsonPlaceholderClient:
-    return JsonPlaceholderClient()
+def get_search_cache(request: Request) -> ResponseCache | None:
+    return get_container(request).search_cache
 
 
-def get_search_orchestrator() -> SearchOrchestrator:
-    service = SearchService(wikipedia_client=get_wikipedia_client())
-    return SearchOrchestrator(search_service=service)
+def get_search_orchestrator(request: Request) -> SearchOrchestrator:
+    return get_container(request).search_orchestrator
 
 
-def get_jsonplaceholder_orchestrator() -> JsonPlaceholderOrchestrator:
-    return JsonPlaceholderOrchestrator(client=get_jsonplaceholder_client())
+def get_jsonplaceholder_orchestrator(request: Request) -> JsonPlaceholderOrchestrator:
+    return get_container(request).jsonplaceholder_orchestrator
 
 
-def get_llm_orchestrator() -> LLMOrchestrator:
-    return LLMOrchestrator(llm_service=LLMService())
+def get_llm_orchestrator(request: Request) -> LLMOrchestrator:
+    return get_container(request).llm_orchestrator
@@ -0,0 +1,29 @@
+"""Long-lived, pooled HTTP client shared by all upstream API clients."""
+import httpx
+
+from app.core.config import Settings
+
+
+class HttpClientRegistry:
+    """Owns the pooled httpx client for the lifetime of the application."""
+
+    def __init__(self, async_client: httpx.AsyncClient) -> None:
+        self.async_client = async_client
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "HttpClientRegistry":
+        limits = httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        )
+        return cls(
+            async_client=httpx.AsyncClient(
+                http2=settings.HTTP2_ENABLED,
+                limits=limits,
+                timeout=httpx.Timeout(settings.HTTP_TIMEOUT),
+            ),
+        )
+
+    async def aclose(self) -> None:
+        await self.async_client.aclose()
@@ -1,6 +1,14 @@
+from collections.abc import Sequence
 from typing import Protocol
 
 
 class SearchClientProtocol(Protocol):
-    def search(self, query: str) -> list[dict[str, str]]:
+    """Async search source; ``search_many`` answers several queries in one call."""
+
+    name: str
+
+    async def search(self, query: str) -> list[dict[str, str]]:
+        ...
+
+    async def search_many(self, queries: Sequence[str]) -> list[list[dict[str, str]]]:
         ...
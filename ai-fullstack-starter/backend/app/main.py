@@ -1,3 +1,6 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -5,10 +8,25 @@ from app.api.routes.health import router as health_router
 from app.api.routes.jsonplaceholder import router as jsonplaceholder_router
 from app.api.routes.llm import router as llm_router
 from app.api.routes.search import router as search_router
+from app.api.routes.search_batch import router as search_batch_router
 from app.core.config import settings
+from app.core.deps import AppContainer
 from app.core.exception_handlers import register_exception_handlers
+from app.services.llm.factory import close_llm_providers
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    container = AppContainer.from_settings(settings)
+    app.state.container = container
+    try:
+        yield
+    finally:
+        await container.aclose()
+        await close_llm_providers()
+
 
-app = FastAPI(title="AI Fullstack Starter API")
+app = FastAPI(title="AI Fullstack Starter API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -22,5 +40,6 @@ register_exception_handlers(app)
 
 app.include_router(health_router, prefix="/api", tags=["health"])
 app.include_router(search_router, prefix="/api/test/wiki_search", tags=["search"])
+app.include_router(search_batch_router, prefix="/api/search", tags=["search"])
 app.include_router(jsonplaceholder_router, prefix="/api/test/jsonplaceholder", tags=["jsonplaceholder"])
 app.include_router(llm_router, prefix="/api/llm", tags=["llm"])
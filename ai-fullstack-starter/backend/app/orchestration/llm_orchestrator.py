@@ -1,4 +1,11 @@
-from app.api.schemas.llm import LLMConfigResponse
+import secrets
+from dataclasses import asdict
+from typing import AsyncGenerator
+
+from app.api.schemas.llm import ChatStreamRequest, LLMConfigResponse, LLMLimiterStatsResponse
+from app.core.config import settings
+from app.services.llm.base import StreamEvent
+from app.services.llm.coalesce import coalesce_deltas
 from app.services.llm_service import LLMService
 
 
@@ -9,3 +16,35 @@ class LLMOrchestrator:
     def config(self) -> LLMConfigResponse:
         data = self.llm_service.get_runtime_config()
         return LLMConfigResponse(**data)
+
+    def limiter_stats(self) -> list[LLMLimiterStatsResponse]:
+        return [
+            LLMLimiterStatsResponse(provider=provider, **asdict(stats))
+            for provider, stats in self.llm_service.get_limiter_stats().items()
+        ]
+
+    def stream_chat(self, payload: ChatStreamRequest) -> AsyncGenerator[StreamEvent, None]:
+        model = payload.model or settings.resolved_llm_model()
+        input_items = [message.model_dump() for message in payload.messages]
+        events: AsyncGenerator[StreamEvent, None]
+        if payload.conversation_id or payload.new_conversation:
+            events = self.llm_service.astream_conversation(
+                conversation_id=payload.conversation_id or secrets.token_urlsafe(24),
+                model=model,
+                new_items=input_items,
+                create=payload.new_conversation,
+            )
+        else:
+            events = self.llm_service.astream_chat(
+                model=model,
+                input_items=input_items,
+                previous_response_id=payload.previous_response_id,
+            )
+        if settings.LLM_STREAM_COALESCE_BYTES <= 0:
+            return events
+        return coalesce_deltas(
+            events,
+            max_bytes=settings.LLM_STREAM_COALESCE_BYTES,
+            max_delay=settings.LLM_STREAM_COALESCE_MS / 1000,
+            buffer_events=settings.LLM_STREAM_BUFFER_EVENTS,
+        )
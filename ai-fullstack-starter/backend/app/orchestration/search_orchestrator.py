@@ -1,6 +1,16 @@
-from app.api.schemas.search import SearchResponse, SearchResult
+import asyncio
+import logging
+
+from app.api.schemas.search import (
+    SearchBatchItem,
+    SearchBatchResponse,
+    SearchResponse,
+    SearchResult,
+)
 from app.services.search_service import SearchService
 
+logger = logging.getLogger(__name__)
+
 
 class SearchOrchestrator:
     def __init__(self, search_service: SearchService) -> None:
@@ -12,3 +22,18 @@ class SearchOrchestrator:
             query=query,
             results=[SearchResult(**item) for item in results],
         )
+
+    async def search_batch(self, queries: list[str], max_concurrency: int) -> SearchBatchResponse:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(query: str) -> SearchBatchItem:
+            async with semaphore:
+                try:
+                    response = await self.search(query)
+                except Exception as exc:
+                    logger.warning("Batch search failed for %r", query, exc_info=True)
+                    return SearchBatchItem(query=query, error=str(exc) or type(exc).__name__)
+            return SearchBatchItem(query=query, results=response.results)
+
+        items = await asyncio.gather(*(run_one(query) for query in queries))
+        return SearchBatchResponse(items=list(items))
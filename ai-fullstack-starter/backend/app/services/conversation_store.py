@@ -0,0 +1,325 @@
+"""Server-side chat history so clients only send the new turn of a conversation."""
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+from app.core.config import Settings
+from app.core.errors import AppError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Conversation:
+    """Stored state of one conversation.
+
+    ``items`` holds user/assistant turns; the latest system prompt is kept separately so
+    windowing never drops it. ``response_id`` is the provider's id for the last reply and is
+    only reused with the same ``provider``. ``stored`` is False for an unknown or expired id.
+    """
+
+    id: str
+    system: str | None = None
+    items: list[dict[str, Any]] = field(default_factory=list)
+    response_id: str | None = None
+    provider: str | None = None
+    stored: bool = False
+
+    def windowed_input(self, new_items: list[dict[str, Any]], window: int) -> list[dict[str, Any]]:
+        """Full provider input: system prompt, the last ``window`` stored turns, then new ones."""
+        system, turns = split_system(new_items)
+        system = system or self.system
+        history = self.items[-window:] if window > 0 else []
+        head = [{"role": "system", "content": system}] if system else []
+        return head + history + turns
+
+
+def split_system(items: list[dict[str, Any]]) -> tuple[str | None, list[dict[str, Any]]]:
+    system = None
+    turns: list[dict[str, Any]] = []
+    for item in items:
+        if item.get("role") == "system":
+            system = item.get("content")
+        else:
+            turns.append(item)
+    return system, turns
+
+
+class ConversationNotFoundError(AppError):
+    """Raised when a request continues a conversation id the store does not know."""
+
+
+def _text(value: bytes | str | None) -> str | None:
+    if isinstance(value, bytes):
+        value = value.decode()
+    return value or None
+
+
+class ConversationStore(Protocol):
+    async def load(self, conversation_id: str, last: int) -> Conversation:
+        """Return the conversation with at most ``last`` recent items (empty if unknown)."""
+        ...
+
+    async def append(
+        self,
+        conversation_id: str,
+        items: list[dict[str, Any]],
+        response_id: str | None,
+        provider: str,
+    ) -> None:
+        ...
+
+    async def aclose(self) -> None:
+        ...
+
+
+class MemoryConversationStore:
+    """In-process store for tests and single-worker development; LRU-bounded with a TTL.
+
+    Each conversation keeps its last ``max_items`` turns (0 keeps all).
+    """
+
+    def __init__(self, max_conversations: int, ttl_seconds: float, max_items: int = 0) -> None:
+        self.max_conversations = max_conversations
+        self.ttl_seconds = ttl_seconds
+        self.max_items = max_items
+        self._conversations: OrderedDict[str, tuple[float, Conversation]] = OrderedDict()
+
+    def _get(self, conversation_id: str) -> Conversation | None:
+        entry = self._conversations.get(conversation_id)
+        if entry is None:
+            return None
+        expires_at, conversation = entry
+        if expires_at <= time.monotonic():
+            del self._conversations[conversation_id]
+            return None
+        return conversation
+
+    async def load(self, conversation_id: str, last: int) -> Conversation:
+        stored = self._get(conversation_id)
+        if stored is None:
+            return Conversation(id=conversation_id)
+        return Conversation(
+            id=conversation_id,
+            system=stored.system,
+            items=stored.items[-last:] if last > 0 else [],
+            response_id=stored.response_id,
+            provider=stored.provider,
+            stored=True,
+        )
+
+    async def append(
+        self,
+        conversation_id: str,
+        items: list[dict[str, Any]],
+        response_id: str | None,
+        provider: str,
+    ) -> None:
+        conversation = self._get(conversation_id) or Conversation(id=conversation_id)
+        system, turns = split_system(items)
+        conversation.system = system or conversation.system
+        conversation.items.extend(turns)
+        if 0 < self.max_items < len(conversation.items):
+            del conversation.items[: -self.max_items]
+        conversation.response_id = response_id
+        conversation.provider = provider
+        self._conversations[conversation_id] = (
+            time.monotonic() + self.ttl_seconds,
+            conversation,
+        )
+        self._conversations.move_to_end(conversation_id)
+        while len(self._conversations) > self.max_conversations:
+            self._conversations.popitem(last=False)
+
+    async def aclose(self) -> None:
+        self._conversations.clear()
+
+
+class RedisConversationStore:
+    """Redis list of JSON turns plus a metadata hash per conversation, both expiring.
+
+    The list is trimmed to the last ``max_items`` turns on every append (0 keeps all).
+    """
+
+    def __init__(
+        self, url: str, ttl_seconds: float, max_items: int = 0, prefix: str = "conversation:"
+    ) -> None:
+        from redis.asyncio import Redis
+
+        self._redis = Redis.from_url(url, decode_responses=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_items = max_items
+        self.prefix = prefix
+
+    async def load(self, conversation_id: str, last: int) -> Conversation:
+        key = self.prefix + conversation_id
+        meta = await self._redis.hgetall(key + ":meta")
+        raw_items = await self._redis.lrange(key + ":items", -last, -1) if last > 0 else []
+        return Conversation(
+            id=conversation_id,
+            system=_text(meta.get("system")),
+            items=[json.loads(raw) for raw in raw_items],
+            response_id=_text(meta.get("response_id")),
+            provider=_text(meta.get("provider")),
+            stored=bool(meta),
+        )
+
+    async def append(
+        self,
+        conversation_id: str,
+        items: list[dict[str, Any]],
+        response_id: str | None,
+        provider: str,
+    ) -> None:
+        key = self.prefix + conversation_id
+        system, turns = split_system(items)
+        meta = ["response_id", response_id or "", "provider", provider]
+        if system:
+            meta += ["system", system]
+        ttl_ms = int(self.ttl_seconds * 1000)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            if turns:
+                pipe.rpush(key + ":items", *[json.dumps(item) for item in turns])
+                if self.max_items > 0:
+                    pipe.ltrim(key + ":items", -self.max_items, -1)
+            pipe.hset(key + ":meta", items=meta)
+            pipe.pexpire(key + ":items", ttl_ms)
+            pipe.pexpire(key + ":meta", ttl_ms)
+            await pipe.execute()
+
+    async def aclose(self) -> None:
+        await self._redis.aclose()
+
+
+class PostgresConversationStore:
+    """Conversations in Postgres (``DATABASE_URL``); tables are created on first use.
+
+    Each conversation keeps its last ``max_items`` turns (0 keeps all).
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS conversations (
+            id TEXT PRIMARY KEY,
+            system TEXT,
+            response_id TEXT,
+            provider TEXT,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        );
+        CREATE TABLE IF NOT EXISTS conversation_items (
+            id BIGSERIAL PRIMARY KEY,
+            conversation_id TEXT NOT NULL REFERENCES conversations (id) ON DELETE CASCADE,
+            item JSONB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS conversation_items_conversation_id_idx
+            ON conversation_items (conversation_id, id);
+    """
+
+    def __init__(self, dsn: str, max_items: int = 0) -> None:
+        self.dsn = dsn
+        self.max_items = max_items
+        self._pool: Any = None
+        self._pool_lock = asyncio.Lock()
+
+    async def _get_pool(self) -> Any:
+        if self._pool is not None:
+            return self._pool
+        async with self._pool_lock:
+            if self._pool is None:
+                import asyncpg
+
+                pool = await asyncpg.create_pool(self.dsn, min_size=1, max_size=10)
+                async with pool.acquire() as connection:
+                    await connection.execute(self._SCHEMA)
+                self._pool = pool
+        return self._pool
+
+    async def load(self, conversation_id: str, last: int) -> Conversation:
+        pool = await self._get_pool()
+        async with pool.acquire() as connection:
+            meta = await connection.fetchrow(
+                "SELECT system, response_id, provider FROM conversations WHERE id = $1",
+                conversation_id,
+            )
+            if meta is None:
+                return Conversation(id=conversation_id)
+            rows = await connection.fetch(
+                "SELECT item FROM ("
+                "  SELECT id, item FROM conversation_items WHERE conversation_id = $1"
+                "  ORDER BY id DESC LIMIT $2"
+                ") AS recent ORDER BY id",
+                conversation_id,
+                max(last, 0),
+            )
+        return Conversation(
+            id=conversation_id,
+            system=meta["system"],
+            items=[json.loads(row["item"]) for row in rows],
+            response_id=meta["response_id"],
+            provider=meta["provider"],
+            stored=True,
+        )
+
+    async def append(
+        self,
+        conversation_id: str,
+        items: list[dict[str, Any]],
+        response_id: str | None,
+        provider: str,
+    ) -> None:
+        system, turns = split_system(items)
+        pool = await self._get_pool()
+        async with pool.acquire() as connection, connection.transaction():
+            await connection.execute(
+                "INSERT INTO conversations (id, system, response_id, provider) "
+                "VALUES ($1, $2, $3, $4) "
+                "ON CONFLICT (id) DO UPDATE SET "
+                "system = COALESCE(EXCLUDED.system, conversations.system), "
+                "response_id = EXCLUDED.response_id, provider = EXCLUDED.provider, "
+                "updated_at = now()",
+                conversation_id,
+                system,
+                response_id,
+                provider,
+            )
+            await connection.executemany(
+                "INSERT INTO conversation_items (conversation_id, item) VALUES ($1, $2::jsonb)",
+                [(conversation_id, json.dumps(item)) for item in turns],
+            )
+            if self.max_items > 0:
+                await connection.execute(
+                    "DELETE FROM conversation_items WHERE conversation_id = $1 AND id <= ("
+                    "  SELECT id FROM conversation_items WHERE conversation_id = $1"
+                    "  ORDER BY id DESC OFFSET $2 LIMIT 1"
+                    ")",
+                    conversation_id,
+                    self.max_items,
+                )
+
+    async def aclose(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+
+
+def build_conversation_store(settings: Settings) -> ConversationStore:
+    backend = settings.CONVERSATION_STORE_BACKEND.strip().lower()
+    if backend == "postgres" and settings.DATABASE_URL:
+        return PostgresConversationStore(
+            settings.DATABASE_URL, max_items=settings.CONVERSATION_MAX_ITEMS
+        )
+    if backend == "redis":
+        return RedisConversationStore(
+            settings.REDIS_URL,
+            ttl_seconds=settings.CONVERSATION_TTL_SECONDS,
+            max_items=settings.CONVERSATION_MAX_ITEMS,
+        )
+    if backend != "memory":
+        logger.warning("Conversation store %r unavailable; using in-memory store", backend)
+    return MemoryConversationStore(
+        max_conversations=settings.CONVERSATION_MAX_CONVERSATIONS,
+        ttl_seconds=settings.CONVERSATION_TTL_SECONDS,
+        max_items=settings.CONVERSATION_MAX_ITEMS,
+    )
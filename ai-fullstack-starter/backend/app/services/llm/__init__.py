@@ -1,4 +1,27 @@
-from app.services.llm.base import LLMChatStream, LLMProvider, StreamEvent
-from app.services.llm.factory import get_llm_provider, register_provider
+from app.services.llm.base import (
+    AsyncLLMChatStream,
+    AsyncLLMProvider,
+    LLMChatStream,
+    LLMProvider,
+    StreamEvent,
+)
+from app.services.llm.factory import (
+    close_llm_providers,
+    get_async_llm_provider,
+    get_llm_provider,
+    invalidate_llm_providers,
+    register_provider,
+)
 
-__all__ = ["LLMProvider", "LLMChatStream", "StreamEvent", "get_llm_provider", "register_provider"]
+__all__ = [
+    "LLMProvider",
+    "LLMChatStream",
+    "AsyncLLMProvider",
+    "AsyncLLMChatStream",
+    "StreamEvent",
+    "get_llm_provider",
+    "get_async_llm_provider",
+    "register_provider",
+    "invalidate_llm_providers",
+    "close_llm_providers",
+]
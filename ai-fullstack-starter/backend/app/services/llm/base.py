@@ -3,16 +3,17 @@ LLM abstraction: interface that any chat provider must implement.
 This is the interface in the factory pattern.
 """
 from dataclasses import dataclass
-from typing import Iterator, Protocol, runtime_checkable
+from typing import Any, AsyncIterator, Iterator, Protocol, runtime_checkable
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StreamEvent:
-    """Normalized event from any LLM stream."""
+    """Normalized event from any LLM stream; slotted and immutable to keep per-token cost low."""
 
     kind: str  # "delta" | "done"
     text: str | None = None
     response_id: str | None = None
+    conversation_id: str | None = None  # set on "done" events of stored conversations
 
 
 @runtime_checkable
@@ -35,7 +36,34 @@ class LLMProvider(Protocol):
     def stream_chat(
         self,
         model: str,
-        input_items: list[dict],
+        input_items: list[dict[str, Any]],
         previous_response_id: str | None = None,
     ) -> LLMChatStream:
         ...
+
+
+@runtime_checkable
+class AsyncLLMChatStream(Protocol):
+    """Async context manager that yields normalized StreamEvent objects."""
+
+    async def __aenter__(self) -> "AsyncLLMChatStream":
+        ...
+
+    async def __aexit__(self, *args: object) -> None:
+        ...
+
+    def __aiter__(self) -> AsyncIterator[StreamEvent]:
+        ...
+
+
+@runtime_checkable
+class AsyncLLMProvider(Protocol):
+    """Async counterpart of LLMProvider; preferred by the factory when implemented."""
+
+    def astream_chat(
+        self,
+        model: str,
+        input_items: list[dict[str, Any]],
+        previous_response_id: str | None = None,
+    ) -> AsyncLLMChatStream:
+        ...
@@ -0,0 +1,276 @@
+"""Response cache in front of an AsyncLLMProvider: exact-match by default, optionally semantic."""
+import asyncio
+import hashlib
+import json
+import logging
+import math
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Protocol
+
+from openai import AsyncOpenAI
+
+from app.core.cache import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+from app.core.config import Settings
+from app.services.llm.base import AsyncLLMChatStream, AsyncLLMProvider, StreamEvent
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_input(input_items: list[dict[str, Any]]) -> list[dict[str, str]]:
+    """Role and whitespace-collapsed content of each item; other fields do not affect replies."""
+    return [
+        {
+            "role": str(item.get("role", "")),
+            "content": " ".join(str(item.get("content", "")).split()),
+        }
+        for item in input_items
+    ]
+
+
+def cache_key(provider: str, model: str, input_items: list[dict[str, Any]]) -> str:
+    payload = json.dumps(
+        {"provider": provider, "model": model, "input": normalize_input(input_items)},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class Embedder(Protocol):
+    async def embed(self, text: str) -> list[float]:
+        ...
+
+
+class OpenAIEmbedder:
+    def __init__(self, api_key: str, model: str) -> None:
+        self._client = AsyncOpenAI(api_key=api_key)
+        self.model = model
+
+    async def embed(self, text: str) -> list[float]:
+        response = await self._client.embeddings.create(model=self.model, input=text)
+        return list(response.data[0].embedding)
+
+    async def aclose(self) -> None:
+        await self._client.close()
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class SemanticIndex:
+    """Small in-process vector index mapping prompt embeddings to exact cache keys.
+
+    Entries only match within the same ``scope`` (provider and model). Lookup is a linear
+    cosine scan, which is fine for the few hundred entries it holds.
+    """
+
+    def __init__(self, max_entries: int, threshold: float) -> None:
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self._entries: OrderedDict[str, tuple[str, list[float]]] = OrderedDict()
+
+    def nearest(self, scope: str, vector: list[float]) -> str | None:
+        best_key, best_score = None, self.threshold
+        for key, (entry_scope, entry_vector) in self._entries.items():
+            if entry_scope != scope:
+                continue
+            score = _cosine(vector, entry_vector)
+            if score >= best_score:
+                best_key, best_score = key, score
+        return best_key
+
+    def add(self, key: str, scope: str, vector: list[float]) -> None:
+        self._entries[key] = (scope, vector)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def replay_events(events: list[dict[str, Any]], chunk_chars: int) -> list[StreamEvent]:
+    """Rebuild a stream from stored events, re-splitting text into ``chunk_chars`` deltas."""
+    text = "".join(event.get("text") or "" for event in events if event["kind"] == "delta")
+    size = max(chunk_chars, 1)
+    replay = [StreamEvent(kind="delta", text=text[i : i + size]) for i in range(0, len(text), size)]
+    for event in events:
+        if event["kind"] != "delta":
+            replay.append(StreamEvent(kind=event["kind"], response_id=event.get("response_id")))
+    return replay
+
+
+class LLMResponseCache:
+    """Stores completed StreamEvent sequences by prompt hash, plus an optional semantic index.
+
+    A prompt whose embedding is within ``semantic_index.threshold`` of a cached one also hits.
+    Every replay drops the provider response id: it belongs to the caller that produced the
+    reply, and continuing from it would expose that caller's conversation.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl_seconds: float,
+        embedder: Embedder | None = None,
+        semantic_index: SemanticIndex | None = None,
+    ) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.embedder = embedder
+        self.semantic_index = semantic_index
+
+    async def lookup(
+        self, provider: str, model: str, input_items: list[dict[str, Any]]
+    ) -> tuple[str, list[float] | None, list[dict[str, Any]] | None]:
+        """Return the exact key, the prompt embedding (semantic mode) and any cached events."""
+        key = cache_key(provider, model, input_items)
+        events = await self.backend.get(key)
+        vector = None
+        if events is None and self.embedder is not None and self.semantic_index is not None:
+            try:
+                vector = await self.embedder.embed(embedding_text(input_items))
+            except Exception:
+                logger.warning(
+                    "Prompt embedding failed; using exact-match cache only", exc_info=True
+                )
+                return key, None, None
+            similar = self.semantic_index.nearest(f"{provider}/{model}", vector)
+            if similar is not None:
+                events = await self.backend.get(similar)
+        if events is not None:
+            events = [{**event, "response_id": None} for event in events]
+        return key, vector, events
+
+    async def store(
+        self,
+        key: str,
+        provider: str,
+        model: str,
+        vector: list[float] | None,
+        events: list[dict[str, Any]],
+    ) -> None:
+        await self.backend.set(key, events, self.ttl_seconds)
+        if vector is not None and self.semantic_index is not None:
+            self.semantic_index.add(key, f"{provider}/{model}", vector)
+
+    async def aclose(self) -> None:
+        await self.backend.aclose()
+        close = getattr(self.embedder, "aclose", None)
+        if close is not None:
+            await close()
+
+
+def embedding_text(input_items: list[dict[str, Any]]) -> str:
+    return "\n".join(f"{item['role']}: {item['content']}" for item in normalize_input(input_items))
+
+
+class _CachedStream:
+    def __init__(self, provider: "CachingProvider", request: dict[str, Any]) -> None:
+        self._provider = provider
+        self._request = request
+        self._replay: list[StreamEvent] | None = None
+        self._key: str | None = None
+        self._vector: list[float] | None = None
+        self._inner: AsyncLLMChatStream | None = None
+
+    async def __aenter__(self) -> "_CachedStream":
+        if self._request["previous_response_id"] is None:
+            self._key, self._vector, events = await self._provider.cache.lookup(
+                self._provider.name, self._request["model"], self._request["input_items"]
+            )
+            if events is not None:
+                self._replay = replay_events(events, self._provider.replay_chunk_chars)
+        if self._replay is None:
+            self._inner = self._provider.inner.astream_chat(**self._request)
+            await self._inner.__aenter__()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        if self._inner is not None:
+            await self._inner.__aexit__(*args)
+
+    async def __aiter__(self) -> AsyncIterator[StreamEvent]:
+        if self._replay is not None:
+            for event in self._replay:
+                yield event
+                await asyncio.sleep(self._provider.replay_delay)
+            return
+        if self._inner is None:
+            raise RuntimeError("Stream not entered. Use 'async with' statement.")
+        limit = self._provider.max_response_chars
+        recorded: list[dict[str, Any]] = []
+        size = 0
+        async for event in self._inner:
+            size += len(event.text or "")
+            if size <= limit:
+                recorded.append(
+                    {"kind": event.kind, "text": event.text, "response_id": event.response_id}
+                )
+            yield event
+        completed = any(event["kind"] == "done" for event in recorded)
+        if self._key is not None and completed and size <= limit:
+            await self._provider.cache.store(
+                self._key, self._provider.name, self._request["model"], self._vector, recorded
+            )
+
+
+class CachingProvider:
+    """Wraps an async provider and replays cached replies for repeated prompts.
+
+    Entries are scoped to the provider ``name``. Only completed streams no longer than
+    ``max_response_chars`` are stored. Requests that continue a provider-side conversation
+    (``previous_response_id``) always go upstream.
+    """
+
+    def __init__(
+        self,
+        inner: AsyncLLMProvider,
+        name: str,
+        cache: LLMResponseCache,
+        replay_chunk_chars: int = 24,
+        replay_delay: float = 0.0,
+        max_response_chars: int = 32_000,
+    ) -> None:
+        self.inner = inner
+        self.name = name
+        self.stateful_responses = getattr(inner, "stateful_responses", False)
+        self.cache = cache
+        self.replay_chunk_chars = replay_chunk_chars
+        self.replay_delay = replay_delay
+        self.max_response_chars = max_response_chars
+
+    def astream_chat(
+        self,
+        model: str,
+        input_items: list[dict[str, Any]],
+        previous_response_id: str | None = None,
+    ) -> AsyncLLMChatStream:
+        request = {
+            "model": model,
+            "input_items": input_items,
+            "previous_response_id": previous_response_id,
+        }
+        return _CachedStream(self, request)
+
+
+def build_llm_response_cache(settings: Settings) -> LLMResponseCache:
+    backend: CacheBackend
+    if settings.LLM_CACHE_BACKEND.strip().lower() == "redis":
+        backend = RedisCacheBackend(settings.REDIS_URL, prefix="llm:")
+    else:
+        backend = MemoryCacheBackend(max_entries=settings.LLM_CACHE_MAX_ENTRIES)
+    embedder: Embedder | None = None
+    semantic_index: SemanticIndex | None = None
+    if settings.LLM_CACHE_SEMANTIC_THRESHOLD > 0 and settings.OPENAI_API_KEY:
+        embedder = OpenAIEmbedder(settings.OPENAI_API_KEY, settings.LLM_CACHE_EMBEDDING_MODEL)
+        semantic_index = SemanticIndex(
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+            threshold=settings.LLM_CACHE_SEMANTIC_THRESHOLD,
+        )
+    return LLMResponseCache(
+        backend=backend,
+        ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+        embedder=embedder,
+        semantic_index=semantic_index,
+    )
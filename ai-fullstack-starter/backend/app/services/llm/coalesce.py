@@ -0,0 +1,87 @@
+"""Stream stage that merges small deltas into fewer, larger writes."""
+import asyncio
+from collections.abc import AsyncIterator
+from typing import AsyncGenerator
+
+import anyio
+
+from app.services.llm.base import StreamEvent
+
+_END = object()
+
+
+async def coalesce_deltas(
+    events: AsyncIterator[StreamEvent],
+    max_bytes: int = 256,
+    max_delay: float = 0.03,
+    buffer_events: int = 64,
+) -> AsyncGenerator[StreamEvent, None]:
+    """Merge consecutive deltas until ``max_bytes`` of text or ``max_delay`` seconds pile up.
+
+    The first delta is passed through at once so time-to-first-token is unchanged; any other
+    event flushes pending text first. Upstream is read by a background task into a queue of
+    ``buffer_events``; when the consumer falls behind, the queue fills and upstream reads stop
+    until it catches up. Closing this generator closes ``events``.
+    """
+    queue: asyncio.Queue[object] = asyncio.Queue(maxsize=buffer_events)
+
+    async def pump() -> None:
+        try:
+            async for event in events:
+                await queue.put(event)
+        except Exception as exc:
+            await queue.put(exc)
+        else:
+            await queue.put(_END)
+        finally:
+            aclose = getattr(events, "aclose", None)
+            if aclose is not None:
+                with anyio.CancelScope(shield=True):
+                    await aclose()
+
+    loop = asyncio.get_running_loop()
+    reader = asyncio.create_task(pump())
+    pending: list[str] = []
+    pending_bytes = 0
+    flush_at: float | None = None
+    first_delta_sent = False
+
+    def flush() -> StreamEvent:
+        nonlocal pending, pending_bytes, flush_at
+        event = StreamEvent(kind="delta", text="".join(pending))
+        pending, pending_bytes, flush_at = [], 0, None
+        return event
+
+    try:
+        while True:
+            timeout = None if flush_at is None else max(flush_at - loop.time(), 0)
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except TimeoutError:
+                yield flush()
+                continue
+            if isinstance(item, StreamEvent) and item.kind == "delta":
+                if not first_delta_sent:
+                    first_delta_sent = True
+                    yield item
+                    continue
+                text = item.text or ""
+                pending.append(text)
+                pending_bytes += len(text.encode())
+                if flush_at is None:
+                    flush_at = loop.time() + max_delay
+                if pending_bytes >= max_bytes:
+                    yield flush()
+                continue
+            if pending:
+                yield flush()
+            if item is _END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            assert isinstance(item, StreamEvent)
+            yield item
+    finally:
+        reader.cancel()
+        with anyio.CancelScope(shield=True):
+            await asyncio.gather(reader, return_exceptions=True)
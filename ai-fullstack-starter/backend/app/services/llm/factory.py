@@ -1,7 +1,22 @@
-"""Provider factory resolved via LLM_PROVIDER in settings."""
+"""Provider factory resolved via LLM_PROVIDER in settings.
+
+Providers are long-lived: one instance per (provider, API key, model) is reused across chat
+turns so its HTTP connection pool is shared. Call invalidate_llm_providers() after changing
+settings at runtime and close_llm_providers() on shutdown.
+"""
+import inspect
+import logging
+import threading
+
 from app.core.config import settings
-from app.services.llm.base import LLMProvider
+from app.services.llm.base import AsyncLLMProvider, LLMProvider
+from app.services.llm.caching import CachingProvider, LLMResponseCache, build_llm_response_cache
+from app.services.llm.limiting import LimitedProvider, LimiterStats, ProviderLimiter
 from app.services.llm.openai_provider import OpenAIProvider
+from app.services.llm.routing import RouteTarget, RoutingProvider
+from app.services.llm.threaded import ThreadedAsyncProvider
+
+logger = logging.getLogger(__name__)
 
 try:
     from app.services.llm.gemini_provider import GeminiProvider
@@ -18,15 +33,167 @@ if _GEMINI_AVAILABLE:
     _registry["gemini"] = GeminiProvider
 
 
-def get_llm_provider() -> LLMProvider:
-    key = (settings.LLM_PROVIDER or "openai").strip().lower()
+_instances: dict[tuple[str, str, str], LLMProvider] = {}
+# The router is async-only, so it is kept out of _registry and cached by its targets' keys.
+_routers: dict[tuple[tuple[str, str, str], ...], "ConfiguredRoutingProvider"] = {}
+_retired: list[LLMProvider] = []
+_response_cache: LLMResponseCache | None = None
+_limiters: dict[str, ProviderLimiter] = {}
+_instances_lock = threading.RLock()
+
+
+class ConfiguredRoutingProvider(RoutingProvider):
+    """RoutingProvider over LLM_ROUTER_PROVIDERS; selected with LLM_PROVIDER=router."""
+
+    def __init__(self) -> None:
+        targets: list[RouteTarget] = []
+        for name in settings.llm_router_provider_list():
+            if name == "router":
+                continue
+            if name in _API_KEY_SETTINGS and not _api_key_for(name):
+                logger.warning("Skipping LLM router target %s: no API key configured", name)
+                continue
+            try:
+                provider = get_async_llm_provider(name, with_cache=False)
+            except Exception:  # Provider SDKs raise their own error types on bad config.
+                logger.warning("Skipping unavailable LLM router target %s", name, exc_info=True)
+                continue
+            targets.append(
+                RouteTarget(name=name, provider=provider, model=settings.resolved_llm_model(name))
+            )
+        hedge_after = settings.LLM_HEDGE_AFTER_MS / 1000 if settings.LLM_HEDGE_AFTER_MS else None
+        super().__init__(
+            targets=targets,
+            first_token_timeout=settings.LLM_FIRST_TOKEN_TIMEOUT_SECONDS,
+            hedge_after=hedge_after,
+        )
+
+
+_API_KEY_SETTINGS = {"openai": "OPENAI_API_KEY", "gemini": "GEMINI_API_KEY"}
+
+
+def _api_key_for(name: str) -> str:
+    setting = _API_KEY_SETTINGS.get(name)
+    return str(getattr(settings, setting)) if setting else ""
+
+
+def get_llm_provider(name: str | None = None) -> LLMProvider:
+    """Return the cached provider for ``name`` (default: LLM_PROVIDER), creating it once."""
+    key = (name or settings.LLM_PROVIDER or "openai").strip().lower()
+    if key == "router":
+        raise ValueError("LLM_PROVIDER=router is async-only; use get_async_llm_provider().")
     if key not in _registry:
         raise ValueError(
-            f"Unknown LLM_PROVIDER={settings.LLM_PROVIDER!r}. "
+            f"Unknown LLM_PROVIDER={name or settings.LLM_PROVIDER!r}. "
             f"Supported: {list(_registry.keys())}"
         )
-    return _registry[key]()
+    cache_key = (key, _api_key_for(key), settings.resolved_llm_model(key))
+    with _instances_lock:
+        provider = _instances.get(cache_key)
+        if provider is None:
+            provider = _registry[key]()
+            _instances[cache_key] = provider
+        return provider
+
+
+def get_async_llm_provider(name: str | None = None, with_cache: bool = True) -> AsyncLLMProvider:
+    """Return the provider's native async API, or a threaded adapter over it.
+
+    Concrete providers are wrapped in LimitedProvider, with one ProviderLimiter per provider
+    name. With LLM_CACHE_ENABLED the result is also wrapped in CachingProvider, sharing one
+    response cache across providers, so cache hits skip the limiter.
+    """
+    key = (name or settings.LLM_PROVIDER or "openai").strip().lower()
+    async_provider: AsyncLLMProvider
+    if key == "router":  # Router targets are limited individually.
+        async_provider = _get_router()
+    else:
+        provider = get_llm_provider(key)
+        async_provider = LimitedProvider(
+            provider if isinstance(provider, AsyncLLMProvider) else ThreadedAsyncProvider(provider),
+            _get_limiter(key),
+        )
+    if not (with_cache and settings.LLM_CACHE_ENABLED):
+        return async_provider
+    return CachingProvider(
+        async_provider,
+        name=key,
+        cache=_get_response_cache(),
+        replay_chunk_chars=settings.LLM_CACHE_REPLAY_CHUNK_CHARS,
+    )
+
+
+def _get_router() -> ConfiguredRoutingProvider:
+    names = [name for name in settings.llm_router_provider_list() if name != "router"]
+    cache_key = tuple((n, _api_key_for(n), settings.resolved_llm_model(n)) for n in names)
+    with _instances_lock:
+        router = _routers.get(cache_key)
+        if router is None:
+            router = ConfiguredRoutingProvider()
+            _routers[cache_key] = router
+        return router
+
+
+def _get_limiter(name: str) -> ProviderLimiter:
+    with _instances_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = ProviderLimiter.from_settings(settings)
+            _limiters[name] = limiter
+        return limiter
+
+
+def get_llm_limiter_stats() -> dict[str, LimiterStats]:
+    with _instances_lock:
+        return {name: limiter.stats for name, limiter in _limiters.items()}
+
+
+def _get_response_cache() -> LLMResponseCache:
+    global _response_cache
+    with _instances_lock:
+        if _response_cache is None:
+            _response_cache = build_llm_response_cache(settings)
+        return _response_cache
 
 
 def register_provider(name: str, provider_class: type[LLMProvider]) -> None:
-    _registry[name.strip().lower()] = provider_class
+    key = name.strip().lower()
+    _registry[key] = provider_class
+    invalidate_llm_providers(key)
+
+
+def invalidate_llm_providers(name: str | None = None) -> None:
+    """Drop cached providers and limiters (all, or those for ``name``) to rebuild them.
+
+    Dropped instances may still be serving streams, so they are closed by
+    close_llm_providers() rather than immediately.
+    """
+    with _instances_lock:
+        for cache_key in [k for k in _instances if name is None or k[0] == name]:
+            _retired.append(_instances.pop(cache_key))
+        for limiter_name in [n for n in _limiters if name is None or n == name]:
+            del _limiters[limiter_name]
+        # Routers hold wrappers around their targets, so any invalidation rebuilds them.
+        _routers.clear()
+
+
+async def close_llm_providers() -> None:
+    """Close every cached and invalidated provider that exposes ``aclose()`` or ``close()``.
+
+    The shared LLM response cache is closed too.
+    """
+    global _response_cache
+    invalidate_llm_providers()
+    with _instances_lock:
+        providers = list(_retired)
+        _retired.clear()
+        response_cache, _response_cache = _response_cache, None
+    if response_cache is not None:
+        await response_cache.aclose()
+    for provider in providers:
+        close = getattr(provider, "aclose", None) or getattr(provider, "close", None)
+        if close is None:
+            continue
+        result = close()
+        if inspect.isawaitable(result):
+            await result
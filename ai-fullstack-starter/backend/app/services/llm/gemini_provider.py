@@ -1,10 +1,11 @@
 """Gemini implementation of LLMProvider using Gemini generateContent streaming."""
-from typing import Any, Iterator
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
 
+import anyio
 import google.generativeai as genai
 
 from app.core.config import settings
-from app.services.llm.base import LLMChatStream, StreamEvent
+from app.services.llm.base import AsyncLLMChatStream, LLMChatStream, StreamEvent
 
 
 class _GeminiStreamAdapter:
@@ -25,21 +26,59 @@ class _GeminiStreamAdapter:
         yield StreamEvent(kind="done", response_id="gemini-stream")
 
 
+class _AsyncGeminiStreamAdapter:
+    def __init__(self, open_stream: Callable[[], Awaitable[Any]]) -> None:
+        self._open_stream = open_stream
+        self._stream: Any = None
+        self._chunks: Any = None
+
+    async def __aenter__(self) -> "_AsyncGeminiStreamAdapter":
+        self._stream = await self._open_stream()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        # Close the chunk iterators so an abandoned stream stops reading from Gemini.
+        stream, self._stream = self._stream, None
+        chunks, self._chunks = self._chunks, None
+        with anyio.CancelScope(shield=True):
+            for iterator in (chunks, getattr(stream, "_iterator", None)):
+                close = getattr(iterator, "aclose", None)
+                if close is not None:
+                    await close()
+
+    async def __aiter__(self) -> AsyncIterator[StreamEvent]:
+        if self._stream is None:
+            raise RuntimeError("Stream not entered. Use 'async with' statement.")
+        self._chunks = self._stream.__aiter__()
+        async for chunk in self._chunks:
+            if hasattr(chunk, "text") and chunk.text:
+                yield StreamEvent(kind="delta", text=chunk.text)
+
+        yield StreamEvent(kind="done", response_id="gemini-stream")
+
+
 class GeminiProvider:
     def __init__(self) -> None:
         api_key = getattr(settings, "GEMINI_API_KEY", "")
         if not api_key:
             raise ValueError("GEMINI_API_KEY not set in environment variables")
         genai.configure(api_key=api_key)
+        self._models: dict[tuple[str, str | None], Any] = {}
 
-    def stream_chat(
-        self,
-        model: str,
-        input_items: list[dict[str, Any]],
-        previous_response_id: str | None = None,
-    ) -> LLMChatStream:
-        del previous_response_id
+    def _model(self, model_name: str, system_instruction: str | None) -> Any:
+        key = (model_name, system_instruction)
+        gemini_model = self._models.get(key)
+        if gemini_model is None:
+            if len(self._models) >= 32:
+                self._models.clear()
+            gemini_model = genai.GenerativeModel(
+                model_name=model_name,
+                system_instruction=system_instruction,
+            )
+            self._models[key] = gemini_model
+        return gemini_model
 
+    def _start_chat(self, model: str, input_items: list[dict[str, Any]]) -> tuple[Any, str]:
         system_instruction = None
         messages: list[dict[str, Any]] = []
         for item in input_items:
@@ -50,13 +89,32 @@ class GeminiProvider:
             elif role in ("user", "assistant"):
                 messages.append({"role": role, "parts": [content]})
 
-        model_name = model or settings.resolved_llm_model()
-        gemini_model = genai.GenerativeModel(
-            model_name=model_name,
-            system_instruction=system_instruction,
-        )
-
+        gemini_model = self._model(model or settings.resolved_llm_model(), system_instruction)
         chat = gemini_model.start_chat(history=messages[:-1] if len(messages) > 1 else [])
         last_message = messages[-1]["parts"][0] if messages else ""
+        return chat, last_message
+
+    def stream_chat(
+        self,
+        model: str,
+        input_items: list[dict[str, Any]],
+        previous_response_id: str | None = None,
+    ) -> LLMChatStream:
+        del previous_response_id
+
+        chat, last_message = self._start_chat(model, input_items)
         response = chat.send_message(last_message, stream=True)
         return _GeminiStreamAdapter(response)
+
+    def astream_chat(
+        self,
+        model: str,
+        input_items: list[dict[str, Any]],
+        previous_response_id: str | None = None,
+    ) -> AsyncLLMChatStream:
+        del previous_response_id
+
+        chat, last_message = self._start_chat(model, input_items)
+        return _AsyncGeminiStreamAdapter(
+            lambda: chat.send_message_async(last_message, stream=True)
+        )
@@ -0,0 +1,259 @@
+"""Admission control for outbound LLM streams: concurrency, rate limits, queueing and retries."""
+import asyncio
+import logging
+import random
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+import anyio
+
+from app.core.config import Settings
+from app.core.errors import AppError
+from app.services.llm.base import AsyncLLMChatStream, AsyncLLMProvider, StreamEvent
+
+logger = logging.getLogger(__name__)
+
+
+class LLMRateLimitError(AppError):
+    """Raised when a request cannot be admitted within the queue wait limit."""
+
+
+def estimate_tokens(input_items: list[dict[str, Any]], output_tokens: int) -> int:
+    """Rough token count (four characters per token) plus an allowance for the reply."""
+    chars = sum(len(str(item.get("content", ""))) for item in input_items)
+    return chars // 4 + output_tokens
+
+
+def retryable_status(exc: BaseException) -> int | None:
+    """HTTP status of a provider error if it is worth retrying (429 or 5xx)."""
+    status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+    if isinstance(status, int) and (status == 429 or 500 <= status < 600):
+        return status
+    return None
+
+
+class TokenBucket:
+    """Refills ``per_minute`` units per minute; reservations may go negative and wait."""
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float) -> float:
+        """Take ``amount`` units and return how many seconds the caller must wait for them."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= min(amount, self.capacity)
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def refund(self, amount: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + min(amount, self.capacity))
+
+
+@dataclass
+class LimiterStats:
+    in_flight: int = 0
+    queued: int = 0
+    admitted: int = 0
+    rejected: int = 0
+    retries: int = 0
+    upstream_errors: int = 0
+
+
+Reservation = list[tuple[TokenBucket, float]]
+
+
+class ProviderLimiter:
+    """Per-provider limits; a zero rate disables that bucket.
+
+    Limiters are cached for the process, so the concurrency semaphore is created per event
+    loop; an asyncio primitive is bound to the first loop that waits on it.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        max_queue_wait: float = 10.0,
+        max_retries: int = 2,
+        backoff_seconds: float = 0.5,
+        output_tokens_estimate: int = 512,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.max_queue_wait = max_queue_wait
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.output_tokens_estimate = output_tokens_estimate
+        self.stats = LimiterStats()
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        self._requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "ProviderLimiter":
+        return cls(
+            max_concurrency=settings.LLM_MAX_CONCURRENT_STREAMS,
+            requests_per_minute=settings.LLM_REQUESTS_PER_MINUTE,
+            tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE,
+            max_queue_wait=settings.LLM_QUEUE_MAX_WAIT_SECONDS,
+            max_retries=settings.LLM_MAX_RETRIES,
+            backoff_seconds=settings.LLM_RETRY_BACKOFF_SECONDS,
+            output_tokens_estimate=settings.LLM_OUTPUT_TOKENS_ESTIMATE,
+        )
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def acquire(self, input_items: list[dict[str, Any]]) -> Reservation:
+        """Wait for a stream slot and rate budget, or raise LLMRateLimitError.
+
+        Returns the rate budget taken, for ``release`` to refund if the stream never opened.
+        """
+        deadline = time.monotonic() + self.max_queue_wait
+        semaphore = self._semaphore()
+        self.stats.queued += 1
+        try:
+            try:
+                await asyncio.wait_for(semaphore.acquire(), self.max_queue_wait)
+            except TimeoutError:
+                self.stats.rejected += 1
+                raise LLMRateLimitError("Too many concurrent LLM streams; try again later.")
+            try:
+                reservations = await self._wait_for_budget(input_items, deadline)
+            except BaseException:
+                semaphore.release()
+                raise
+        finally:
+            self.stats.queued -= 1
+        self.stats.admitted += 1
+        self.stats.in_flight += 1
+        return reservations
+
+    async def _wait_for_budget(
+        self, input_items: list[dict[str, Any]], deadline: float
+    ) -> Reservation:
+        reservations: Reservation = []
+        if self._requests is not None:
+            reservations.append((self._requests, 1))
+        if self._tokens is not None:
+            reservations.append(
+                (self._tokens, estimate_tokens(input_items, self.output_tokens_estimate))
+            )
+        wait = max((bucket.reserve(amount) for bucket, amount in reservations), default=0.0)
+        if time.monotonic() + wait > deadline:
+            self._refund(reservations)
+            self.stats.rejected += 1
+            raise LLMRateLimitError("LLM rate limit reached; try again later.")
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except BaseException:
+                self._refund(reservations)
+                raise
+        return reservations
+
+    def _refund(self, reservations: Reservation) -> None:
+        for bucket, amount in reservations:
+            bucket.refund(amount)
+
+    def release(self, refund: Reservation | None = None) -> None:
+        """Free the stream slot; ``refund`` returns budget for a stream that never opened."""
+        if refund:
+            self._refund(refund)
+        self.stats.in_flight -= 1
+        self._semaphore().release()
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for retry ``attempt`` (0-based)."""
+        return random.uniform(0, self.backoff_seconds * 2**attempt)
+
+
+class _LimitedStream:
+    def __init__(self, provider: "LimitedProvider", request: dict[str, Any]) -> None:
+        self._provider = provider
+        self._request = request
+        self._inner: AsyncLLMChatStream | None = None
+
+    async def __aenter__(self) -> "_LimitedStream":
+        limiter = self._provider.limiter
+        reservations = await limiter.acquire(self._request["input_items"])
+        try:
+            self._inner = await self._open()
+        except BaseException:
+            limiter.release(refund=reservations)
+            raise
+        return self
+
+    async def _open(self) -> AsyncLLMChatStream:
+        # Retries only cover opening the stream, before any event reached the caller.
+        limiter = self._provider.limiter
+        attempt = 0
+        while True:
+            stream = self._provider.inner.astream_chat(**self._request)
+            try:
+                await stream.__aenter__()
+                return stream
+            except Exception as exc:
+                status = retryable_status(exc)
+                if status is None:
+                    raise
+                limiter.stats.upstream_errors += 1
+                if attempt >= limiter.max_retries:
+                    raise
+                delay = limiter.backoff(attempt)
+                attempt += 1
+                limiter.stats.retries += 1
+                logger.warning(
+                    "LLM provider returned %s; retry %s in %.2fs", status, attempt, delay
+                )
+                await asyncio.sleep(delay)
+
+    async def __aexit__(self, *args: object) -> None:
+        if self._inner is None:
+            return
+        try:
+            with anyio.CancelScope(shield=True):
+                await self._inner.__aexit__(*args)
+        finally:
+            self._inner = None
+            self._provider.limiter.release()
+
+    async def __aiter__(self) -> AsyncIterator[StreamEvent]:
+        if self._inner is None:
+            raise RuntimeError("Stream not entered. Use 'async with' statement.")
+        async for event in self._inner:
+            yield event
+
+
+class LimitedProvider:
+    """Applies a ProviderLimiter to every stream opened through ``inner``."""
+
+    def __init__(self, inner: AsyncLLMProvider, limiter: ProviderLimiter) -> None:
+        self.inner = inner
+        self.limiter = limiter
+        self.stateful_responses = getattr(inner, "stateful_responses", False)
+
+    def astream_chat(
+        self,
+        model: str,
+        input_items: list[dict[str, Any]],
+        previous_response_id: str | None = None,
+    ) -> AsyncLLMChatStream:
+        request = {
+            "model": model,
+            "input_items": input_items,
+            "previous_response_id": previous_response_id,
+        }
+        return _LimitedStream(self, request)
@@ -1,10 +1,12 @@
 """OpenAI implementation of LLMProvider using Responses API streaming."""
-from typing import Any, Iterator
+from typing import Any, AsyncIterator, Iterator, cast
 
-from openai import OpenAI
+import anyio
+from openai import AsyncOpenAI, OpenAI
+from openai.types.responses import ResponseInputParam
 
 from app.core.config import settings
-from app.services.llm.base import LLMChatStream, StreamEvent
+from app.services.llm.base import AsyncLLMChatStream, LLMChatStream, StreamEvent
 
 
 class _OpenAIStreamAdapter:
@@ -30,9 +32,42 @@ class _OpenAIStreamAdapter:
                 yield StreamEvent(kind="done", response_id=rid)
 
 
+class _AsyncOpenAIStreamAdapter:
+    def __init__(self, openai_stream: Any) -> None:
+        self._stream_manager = openai_stream
+        self._stream: Any = None
+
+    async def __aenter__(self) -> "_AsyncOpenAIStreamAdapter":
+        self._stream = await self._stream_manager.__aenter__()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        with anyio.CancelScope(shield=True):
+            await self._stream_manager.__aexit__(*args)
+
+    async def __aiter__(self) -> AsyncIterator[StreamEvent]:
+        if self._stream is None:
+            raise RuntimeError("Stream not entered. Use 'async with' statement.")
+        async for event in self._stream:
+            if event.type == "response.output_text.delta":
+                yield StreamEvent(kind="delta", text=event.delta or "")
+            elif event.type == "response.completed" and getattr(event, "response", None):
+                rid = getattr(event.response, "id", None) or ""
+                yield StreamEvent(kind="done", response_id=rid)
+
+
 class OpenAIProvider:
+    # The Responses API keeps conversation state, so previous_response_id can replace history.
+    stateful_responses = True
+
     def __init__(self) -> None:
         self._client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        # LimitedProvider retries async stream opens and counts them, so the SDK must not retry.
+        self._async_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, max_retries=0)
+
+    async def aclose(self) -> None:
+        self._client.close()
+        await self._async_client.close()
 
     def stream_chat(
         self,
@@ -42,7 +77,20 @@ class OpenAIProvider:
     ) -> LLMChatStream:
         raw = self._client.responses.stream(
             model=model,
-            input=input_items,
+            input=cast(ResponseInputParam, input_items),
             previous_response_id=previous_response_id,
         )
         return _OpenAIStreamAdapter(raw)
+
+    def astream_chat(
+        self,
+        model: str,
+        input_items: list[dict[str, Any]],
+        previous_response_id: str | None = None,
+    ) -> AsyncLLMChatStream:
+        raw = self._async_client.responses.stream(
+            model=model,
+            input=cast(ResponseInputParam, input_items),
+            previous_response_id=previous_response_id,
+        )
+        return _AsyncOpenAIStreamAdapter(raw)
@@ -0,0 +1,172 @@
+"""Routing provider: failover and hedging across several providers on time-to-first-token."""
+import asyncio
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+import anyio
+
+from app.core.errors import UpstreamServiceError
+from app.services.llm.base import AsyncLLMChatStream, AsyncLLMProvider, StreamEvent
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RouteTarget:
+    name: str
+    provider: AsyncLLMProvider
+    model: str
+
+
+@dataclass
+class _Opened:
+    target: RouteTarget
+    stream: AsyncLLMChatStream
+    events: AsyncIterator[StreamEvent]
+    first: StreamEvent
+
+
+async def _close(stream: AsyncLLMChatStream) -> None:
+    with anyio.CancelScope(shield=True):
+        try:
+            await stream.__aexit__(None, None, None)
+        except Exception:
+            logger.debug("Closing abandoned LLM stream failed", exc_info=True)
+
+
+class _RoutedStream:
+    def __init__(self, router: "RoutingProvider", request: dict[str, Any]) -> None:
+        self._router = router
+        self._request = request
+        self._opened: _Opened | None = None
+
+    @property
+    def provider_name(self) -> str | None:
+        return self._opened.target.name if self._opened else None
+
+    async def __aenter__(self) -> "_RoutedStream":
+        self._opened = await self._router._race(self._request)
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        if self._opened is not None:
+            await _close(self._opened.stream)
+
+    async def __aiter__(self) -> AsyncIterator[StreamEvent]:
+        if self._opened is None:
+            raise RuntimeError("Stream not entered. Use 'async with' statement.")
+        yield self._opened.first
+        async for event in self._opened.events:
+            yield event
+
+
+class RoutingProvider:
+    """Streams from the first target that produces an event within ``first_token_timeout``.
+
+    Targets are tried in order; a target that errors or misses the deadline is abandoned
+    and the next one starts. With ``hedge_after`` set, the next target also starts when the
+    current one has been silent that long, and whichever produces an event first wins.
+    Each target uses its own model; the ``model`` argument is ignored.
+    """
+
+    def __init__(
+        self,
+        targets: Sequence[RouteTarget],
+        first_token_timeout: float = 5.0,
+        hedge_after: float | None = None,
+    ) -> None:
+        if not targets:
+            raise ValueError("RoutingProvider needs at least one target")
+        self.targets = list(targets)
+        self.first_token_timeout = first_token_timeout
+        self.hedge_after = hedge_after
+
+    def astream_chat(
+        self,
+        model: str,
+        input_items: list[dict[str, Any]],
+        previous_response_id: str | None = None,
+    ) -> AsyncLLMChatStream:
+        del model
+        request = {"input_items": input_items, "previous_response_id": previous_response_id}
+        return _RoutedStream(self, request)
+
+    async def _open(self, target: RouteTarget, request: dict[str, Any]) -> _Opened:
+        stream = target.provider.astream_chat(model=target.model, **request)
+        await stream.__aenter__()
+        try:
+            events = stream.__aiter__()
+            first = await anext(events, None)
+            if first is None:
+                raise UpstreamServiceError(f"LLM provider {target.name} returned an empty stream.")
+        except BaseException:
+            await _close(stream)
+            raise
+        return _Opened(target=target, stream=stream, events=events, first=first)
+
+    async def _race(self, request: dict[str, Any]) -> _Opened:
+        loop = asyncio.get_running_loop()
+        remaining = iter(self.targets)
+        deadlines: dict[asyncio.Task[_Opened], float] = {}
+        names: dict[asyncio.Task[_Opened], str] = {}
+        next_launch_at = loop.time()
+
+        def launch() -> bool:
+            nonlocal next_launch_at
+            target = next(remaining, None)
+            if target is None:
+                return False
+            task = asyncio.create_task(self._open(target, request))
+            now = loop.time()
+            deadlines[task] = now + self.first_token_timeout
+            names[task] = target.name
+            next_launch_at = now + self.hedge_after if self.hedge_after else float("inf")
+            return True
+
+        winner: _Opened | None = None
+        try:
+            launch()
+            while winner is None:
+                if not deadlines and not launch():
+                    raise UpstreamServiceError("No LLM provider produced a first token in time.")
+                wake_at = min(min(deadlines.values()), next_launch_at)
+                done, _ = await asyncio.wait(
+                    deadlines,
+                    timeout=max(wake_at - loop.time(), 0),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                # Prefer the earliest-launched target if several finish together.
+                for task in [t for t in deadlines if t in done]:
+                    del deadlines[task]
+                    error = task.exception()
+                    if error is not None:
+                        logger.warning("LLM provider %s failed", names[task], exc_info=error)
+                    elif winner is None:
+                        winner = task.result()
+                    else:
+                        await _close(task.result().stream)
+                if winner is not None:
+                    break
+                now = loop.time()
+                expired = [t for t, deadline in deadlines.items() if deadline <= now]
+                for task in expired:
+                    del deadlines[task]
+                    logger.warning("LLM provider %s missed the first-token deadline", names[task])
+                await self._abandon(expired)
+                if now >= next_launch_at:
+                    launch()
+        finally:
+            await self._abandon(list(deadlines))
+        logger.info("LLM stream served by %s", winner.target.name)
+        return winner
+
+    async def _abandon(self, tasks: list[asyncio.Task[_Opened]]) -> None:
+        for task in tasks:
+            task.cancel()
+        with anyio.CancelScope(shield=True):
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, _Opened):
+                await _close(result.stream)
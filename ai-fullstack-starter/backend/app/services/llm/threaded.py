@@ -0,0 +1,56 @@
+"""Run a synchronous LLMProvider behind the async interface using worker threads."""
+from typing import Any, AsyncIterator
+
+import anyio
+
+from app.services.llm.base import AsyncLLMChatStream, LLMChatStream, LLMProvider, StreamEvent
+
+
+class _ThreadedStreamAdapter:
+    def __init__(self, open_stream: Any) -> None:
+        self._open_stream = open_stream
+        self._stream: LLMChatStream | None = None
+
+    async def __aenter__(self) -> "_ThreadedStreamAdapter":
+        stream = await anyio.to_thread.run_sync(self._open_stream)
+        await anyio.to_thread.run_sync(stream.__enter__)
+        self._stream = stream
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        if self._stream is None:
+            return
+        with anyio.CancelScope(shield=True):
+            await anyio.to_thread.run_sync(self._stream.__exit__, None, None, None)
+
+    async def __aiter__(self) -> AsyncIterator[StreamEvent]:
+        if self._stream is None:
+            raise RuntimeError("Stream not entered. Use 'async with' statement.")
+        events = iter(self._stream)
+        while True:
+            event = await anyio.to_thread.run_sync(next, events, None)
+            if event is None:
+                break
+            yield event
+
+
+class ThreadedAsyncProvider:
+    """Adapter for providers that only implement the blocking stream_chat."""
+
+    def __init__(self, provider: LLMProvider) -> None:
+        self.provider = provider
+        self.stateful_responses = getattr(provider, "stateful_responses", False)
+
+    def astream_chat(
+        self,
+        model: str,
+        input_items: list[dict[str, Any]],
+        previous_response_id: str | None = None,
+    ) -> AsyncLLMChatStream:
+        return _ThreadedStreamAdapter(
+            lambda: self.provider.stream_chat(
+                model=model,
+                input_items=input_items,
+                previous_response_id=previous_response_id,
+            )
+        )
@@ -1,8 +1,21 @@
+from dataclasses import replace
+from typing import Any, AsyncGenerator
+
 from app.core.config import settings
-from app.services.llm.factory import get_llm_provider
+from app.services.conversation_store import ConversationNotFoundError, ConversationStore
+from app.services.llm.base import LLMChatStream, StreamEvent
+from app.services.llm.factory import (
+    get_async_llm_provider,
+    get_llm_limiter_stats,
+    get_llm_provider,
+)
+from app.services.llm.limiting import LimiterStats
 
 
 class LLMService:
+    def __init__(self, conversation_store: ConversationStore | None = None) -> None:
+        self.conversation_store = conversation_store
+
     def get_runtime_config(self) -> dict[str, str | bool]:
         provider = (settings.LLM_PROVIDER or "openai").strip().lower()
         return {
@@ -12,15 +25,100 @@ class LLMService:
             "has_gemini_key": bool(settings.GEMINI_API_KEY),
         }
 
+    def get_limiter_stats(self) -> dict[str, LimiterStats]:
+        return get_llm_limiter_stats()
+
     def stream_chat(
         self,
         model: str,
-        input_items: list[dict],
+        input_items: list[dict[str, Any]],
         previous_response_id: str | None = None,
-    ):
+    ) -> LLMChatStream:
         provider = get_llm_provider()
         return provider.stream_chat(
             model=model,
             input_items=input_items,
             previous_response_id=previous_response_id,
         )
+
+    async def astream_chat(
+        self,
+        model: str,
+        input_items: list[dict[str, Any]],
+        previous_response_id: str | None = None,
+    ) -> AsyncGenerator[StreamEvent, None]:
+        """Stream events from the provider's async API.
+
+        Closing or cancelling the generator exits the provider stream, which closes the
+        upstream connection.
+        """
+        provider = get_async_llm_provider()
+        stream = provider.astream_chat(
+            model=model,
+            input_items=input_items,
+            previous_response_id=previous_response_id,
+        )
+        async with stream:
+            async for event in stream:
+                yield event
+
+    async def astream_conversation(
+        self,
+        conversation_id: str,
+        model: str,
+        new_items: list[dict[str, Any]],
+        create: bool = False,
+    ) -> AsyncGenerator[StreamEvent, None]:
+        """Stream a reply to ``new_items`` using server-side history for ``conversation_id``.
+
+        Providers with server-side response state (``stateful_responses``) get only the new
+        turn plus the stored response id. Others get the system prompt and the last
+        CONVERSATION_WINDOW_ITEMS stored turns. The turn is saved once the reply completes.
+        Unless ``create`` is set, ``conversation_id`` must already be stored; ids are issued
+        by the server, so a client cannot join another caller's conversation by guessing one.
+        """
+        if self.conversation_store is None:
+            raise RuntimeError("Conversation store is not configured")
+        store = self.conversation_store
+        window = settings.CONVERSATION_WINDOW_ITEMS
+        provider_key = (settings.LLM_PROVIDER or "openai").strip().lower()
+        provider = get_async_llm_provider()
+        conversation = await store.load(conversation_id, last=window)
+        if not create and not conversation.stored:
+            raise ConversationNotFoundError("Unknown or expired conversation_id")
+
+        if (
+            getattr(provider, "stateful_responses", False)
+            and conversation.response_id
+            and conversation.provider == provider_key
+        ):
+            input_items, previous_response_id = new_items, conversation.response_id
+        else:
+            input_items = conversation.windowed_input(new_items, window)
+            previous_response_id = None
+
+        reply: list[str] = []
+        response_id: str | None = None
+        completed = False
+        stream = provider.astream_chat(
+            model=model,
+            input_items=input_items,
+            previous_response_id=previous_response_id,
+        )
+        async with stream:
+            async for event in stream:
+                if event.kind == "delta" and event.text:
+                    reply.append(event.text)
+                elif event.kind == "done":
+                    response_id = event.response_id
+                    completed = True
+                    event = replace(event, conversation_id=conversation_id)
+                yield event
+
+        if completed:
+            await store.append(
+                conversation_id,
+                [*new_items, {"role": "assistant", "content": "".join(reply)}],
+                response_id=response_id,
+                provider=provider_key,
+            )
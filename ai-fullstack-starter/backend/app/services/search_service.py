@@ -1,9 +1,102 @@
-from app.clients.wikipedia_client import WikipediaClient
+import asyncio
+import logging
+from collections.abc import Callable, Sequence
+from urllib.parse import urlsplit, urlunsplit
+
+from app.core.cache import ResponseCache
+from app.core.errors import UpstreamServiceError
+from app.core.protocols import SearchClientProtocol
+
+logger = logging.getLogger(__name__)
+
+RankingFunction = Callable[[dict[str, str], int], float]
+
+
+def reciprocal_rank(result: dict[str, str], position: int) -> float:
+    """Reciprocal rank fusion score; URLs found by several sources add up."""
+    del result
+    return 1.0 / (60 + position + 1)
+
+
+def normalize_url(url: str) -> str:
+    """Merge key for a URL: scheme and host are case-insensitive, path and query are not."""
+    parts = urlsplit(url.strip())
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/"),
+            parts.query,
+            parts.fragment,
+        )
+    )
 
 
 class SearchService:
-    def __init__(self, wikipedia_client: WikipediaClient) -> None:
-        self.wikipedia_client = wikipedia_client
+    """Federated search: queries every client concurrently and merges results by URL."""
+
+    def __init__(
+        self,
+        clients: Sequence[SearchClientProtocol],
+        cache: ResponseCache | None = None,
+        deadline_seconds: float = 2.0,
+        ranking: RankingFunction = reciprocal_rank,
+    ) -> None:
+        self.clients = list(clients)
+        self.cache = cache
+        self.deadline_seconds = deadline_seconds
+        self.ranking = ranking
 
     async def search(self, query: str) -> list[dict[str, str]]:
-        return await self.wikipedia_client.search(query)
+        tasks = {
+            asyncio.create_task(self._search_client(client, query)): client.name
+            for client in self.clients
+        }
+        if not tasks:
+            return []
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=self.deadline_seconds)
+            for task in pending:
+                logger.warning("Search source %s missed the deadline", tasks[task])
+        finally:
+            # Also runs when the caller is cancelled, so no source request outlives the search.
+            unfinished = [task for task in tasks if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            if unfinished:
+                await asyncio.wait(unfinished)
+
+        # Walk tasks in client order so ties and duplicate URLs resolve deterministically.
+        per_source: list[list[dict[str, str]]] = []
+        for task in tasks:
+            if task not in done or task.cancelled():
+                continue
+            if task.exception() is not None:
+                logger.warning("Search source %s failed", tasks[task], exc_info=task.exception())
+                continue
+            per_source.append(task.result())
+        if not per_source:
+            raise UpstreamServiceError(f"No search source answered query {query!r}.")
+        return self._merge(per_source)
+
+    async def _search_client(
+        self, client: SearchClientProtocol, query: str
+    ) -> list[dict[str, str]]:
+        if self.cache is None:
+            return await client.search(query)
+        key = f"{client.name}:" + " ".join(query.split()).casefold()
+        result: list[dict[str, str]] = await self.cache.get_or_load(
+            key, lambda: client.search(query)
+        )
+        return result
+
+    def _merge(self, per_source: list[list[dict[str, str]]]) -> list[dict[str, str]]:
+        scores: dict[str, float] = {}
+        merged: dict[str, dict[str, str]] = {}
+        for results in per_source:
+            for position, item in enumerate(results):
+                key = normalize_url(item.get("url", ""))
+                scores[key] = scores.get(key, 0.0) + self.ranking(item, position)
+                merged.setdefault(key, item)
+        ranked = sorted(merged, key=lambda key: scores[key], reverse=True)
+        return [merged[key] for key in ranked]
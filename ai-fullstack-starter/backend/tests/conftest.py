@@ -0,0 +1,105 @@
+import asyncio
+from typing import Any, AsyncIterator, Iterator
+
+import pytest
+
+from app.core.config import settings
+from app.services.llm.base import StreamEvent
+from app.services.llm.factory import _registry, invalidate_llm_providers, register_provider
+
+
+class StatusError(Exception):
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+class ScriptedStream:
+    def __init__(self, provider: "ScriptedProvider", index: int) -> None:
+        self.provider = provider
+        self.index = index
+
+    async def __aenter__(self) -> "ScriptedStream":
+        if self.provider.open_failures:
+            raise StatusError(self.provider.open_failures.pop(0))
+        self.provider.active += 1
+        self.provider.peak = max(self.provider.peak, self.provider.active)
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        self.provider.active -= 1
+        self.provider.closed += 1
+
+    async def __aiter__(self) -> AsyncIterator[StreamEvent]:
+        await asyncio.sleep(self.provider.first_token_delay)
+        if self.provider.fail:
+            raise RuntimeError("provider down")
+        for chunk in self.provider.chunks or [f"{self.provider.name}{self.index}"]:
+            yield StreamEvent(kind="delta", text=chunk)
+        yield StreamEvent(kind="done", response_id=f"resp-{self.index}")
+
+
+class ScriptedProvider:
+    """Async provider fake: replies with ``chunks`` (or ``<name><n>``) and records every call."""
+
+    def __init__(
+        self,
+        name: str = "fake",
+        chunks: list[str] | None = None,
+        first_token_delay: float = 0.0,
+        fail: bool = False,
+        open_failures: list[int] | None = None,
+        stateful_responses: bool = False,
+    ) -> None:
+        self.name = name
+        self.chunks = chunks
+        self.first_token_delay = first_token_delay
+        self.fail = fail
+        self.open_failures = open_failures or []
+        self.stateful_responses = stateful_responses
+        self.calls: list[dict[str, Any]] = []
+        self.closed = 0
+        self.active = 0
+        self.peak = 0
+
+    @property
+    def opened(self) -> int:
+        return len(self.calls)
+
+    def stream_chat(self, *args: object, **kwargs: object) -> None:
+        raise NotImplementedError
+
+    def astream_chat(
+        self,
+        model: str,
+        input_items: list[dict[str, Any]],
+        previous_response_id: str | None = None,
+    ) -> ScriptedStream:
+        self.calls.append(
+            {"input_items": input_items, "previous_response_id": previous_response_id}
+        )
+        return ScriptedStream(self, len(self.calls))
+
+
+def collect(provider: Any, content: str = "hi", **kwargs: Any) -> list[StreamEvent]:
+    """Run one ``astream_chat`` turn to completion and return its events."""
+
+    async def run() -> list[StreamEvent]:
+        items = [{"role": "user", "content": content}]
+        async with provider.astream_chat("m", items, **kwargs) as stream:
+            return [event async for event in stream]
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def use_provider(monkeypatch: pytest.MonkeyPatch) -> Iterator[Any]:
+    """Make ``use_provider(provider)`` the active LLM_PROVIDER for the test."""
+
+    def use(provider: Any) -> None:
+        register_provider("scripted", lambda: provider)  # type: ignore[arg-type]
+        monkeypatch.setattr(settings, "LLM_PROVIDER", "scripted")
+
+    yield use
+    _registry.pop("scripted", None)
+    invalidate_llm_providers("scripted")
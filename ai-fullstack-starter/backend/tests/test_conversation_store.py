@@ -0,0 +1,130 @@
+import asyncio
+import json
+from typing import Any
+
+import pytest
+from conftest import ScriptedProvider
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.services.conversation_store import ConversationNotFoundError, MemoryConversationStore
+from app.services.llm_service import LLMService
+
+
+def run_turns(provider: ScriptedProvider, turns: list[str]) -> list[dict[str, Any]]:
+    service = LLMService(MemoryConversationStore(max_conversations=10, ttl_seconds=60))
+
+    async def run() -> None:
+        for index, text in enumerate(turns):
+            items = [{"role": "user", "content": text}]
+            if index == 0:
+                items.insert(0, {"role": "system", "content": "be brief"})
+            conversation = service.astream_conversation("c1", "model", items, create=index == 0)
+            async for _ in conversation:
+                pass
+
+    asyncio.run(run())
+    return provider.calls
+
+
+def test_stateful_provider_gets_only_new_turn_and_previous_response_id(use_provider: Any) -> None:
+    provider = ScriptedProvider("r", stateful_responses=True)
+    use_provider(provider)
+    calls = run_turns(provider, ["hi", "again"])
+    assert calls[1] == {
+        "input_items": [{"role": "user", "content": "again"}],
+        "previous_response_id": "resp-1",
+    }
+
+
+def test_stateless_provider_gets_windowed_history_with_system_prompt(
+    use_provider: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "CONVERSATION_WINDOW_ITEMS", 2)
+    provider = ScriptedProvider("r")
+    use_provider(provider)
+    calls = run_turns(provider, ["one", "two", "three"])
+    assert calls[2]["previous_response_id"] is None
+    assert calls[2]["input_items"] == [
+        {"role": "system", "content": "be brief"},
+        {"role": "user", "content": "two"},
+        {"role": "assistant", "content": "r2"},
+        {"role": "user", "content": "three"},
+    ]
+
+
+def test_unknown_conversation_id_is_rejected(use_provider: Any) -> None:
+    provider = ScriptedProvider("r")
+    use_provider(provider)
+    service = LLMService(MemoryConversationStore(max_conversations=10, ttl_seconds=60))
+
+    async def run() -> None:
+        items = [{"role": "user", "content": "hi"}]
+        async for _ in service.astream_conversation("guessed", "model", items):
+            pass
+
+    with pytest.raises(ConversationNotFoundError):
+        asyncio.run(run())
+    assert provider.calls == []
+
+
+def sse_events(body: str) -> list[tuple[str, dict[str, Any]]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        name, data = block.split("\n")
+        events.append((name.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+def test_chat_route_issues_conversation_ids(use_provider: Any) -> None:
+    use_provider(ScriptedProvider("r"))
+    with TestClient(app) as client:
+        first = client.post(
+            "/api/llm/chat/stream",
+            json={"messages": [{"role": "user", "content": "hi"}], "new_conversation": True},
+        )
+        done = sse_events(first.text)[-1]
+        conversation_id = done[1]["conversation_id"]
+        second = client.post(
+            "/api/llm/chat/stream",
+            json={
+                "messages": [{"role": "user", "content": "again"}],
+                "conversation_id": conversation_id,
+            },
+        )
+        guessed = client.post(
+            "/api/llm/chat/stream",
+            json={"messages": [{"role": "user", "content": "hi"}], "conversation_id": "c1"},
+        )
+
+    assert done[0] == "done" and len(conversation_id) >= 32
+    assert sse_events(second.text)[-1][1]["conversation_id"] == conversation_id
+    assert sse_events(guessed.text) == [
+        (
+            "error",
+            {"error": "Unknown or expired conversation_id", "code": "conversation_not_found"},
+        )
+    ]
+
+
+def test_memory_store_evicts_least_recently_used() -> None:
+    store = MemoryConversationStore(max_conversations=1, ttl_seconds=60)
+
+    async def run() -> tuple[int, int]:
+        await store.append("a", [{"role": "user", "content": "x"}], None, "openai")
+        await store.append("b", [{"role": "user", "content": "y"}], None, "openai")
+        return len((await store.load("a", 10)).items), len((await store.load("b", 10)).items)
+
+    assert asyncio.run(run()) == (0, 1)
+
+
+def test_memory_store_trims_to_max_items() -> None:
+    store = MemoryConversationStore(max_conversations=10, ttl_seconds=60, max_items=3)
+
+    async def run() -> list[str]:
+        for turn in range(5):
+            await store.append("a", [{"role": "user", "content": str(turn)}], None, "openai")
+        return [item["content"] for item in (await store.load("a", 10)).items]
+
+    assert asyncio.run(run()) == ["2", "3", "4"]
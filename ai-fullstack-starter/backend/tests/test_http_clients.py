@@ -0,0 +1,60 @@
+import httpx
+from fastapi.testclient import TestClient
+
+from app.core.http_clients import HttpClientRegistry
+from app.main import app
+
+
+def test_lifespan_owns_pooled_clients() -> None:
+    with TestClient(app):
+        registry = app.state.container.http_clients
+        assert isinstance(registry, HttpClientRegistry)
+        assert not registry.async_client.is_closed
+    assert registry.async_client.is_closed
+
+
+def test_search_reuses_shared_client() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.params["srsearch"])
+        return httpx.Response(200, json={"query": {"search": [{"title": "Python"}]}})
+
+    transport = httpx.MockTransport(handler)
+    registry = HttpClientRegistry(async_client=httpx.AsyncClient(transport=transport))
+    with TestClient(app) as client, app.state.container.override(http_clients=registry):
+        first = client.get("/api/test/wiki_search", params={"q": "python"})
+        second = client.get("/api/test/wiki_search", params={"q": "pythons"})
+
+    assert first.status_code == 200
+    assert second.json()["results"][0]["url"] == "https://en.wikipedia.org/wiki/Python"
+    assert calls == ["python", "pythons"]
+
+
+def test_jsonplaceholder_posts_paginates_upstream() -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        limit = int(request.url.params["_limit"])
+        return httpx.Response(200, json=[{"id": i} for i in range(1, limit + 1)])
+
+    registry = HttpClientRegistry(
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    with TestClient(app) as client, app.state.container.override(http_clients=registry):
+        response = client.get("/api/test/jsonplaceholder/posts", params={"limit": 3})
+
+    assert response.status_code == 200
+    assert [post["id"] for post in response.json()] == [1, 2, 3]
+    assert seen == ["https://jsonplaceholder.typicode.com/posts?_limit=3"]
+
+
+def test_container_builds_services_once_and_restores_overrides() -> None:
+    with TestClient(app):
+        container = app.state.container
+        orchestrator = container.search_orchestrator
+        with container.override(search_cache=None):
+            assert container.search_orchestrator is not orchestrator
+            assert container.search_orchestrator.search_service.cache is None
+        assert container.search_orchestrator is orchestrator
@@ -0,0 +1,80 @@
+import asyncio
+from typing import Any
+
+from conftest import ScriptedProvider, collect
+
+from app.core.cache import MemoryCacheBackend
+from app.services.conversation_store import MemoryConversationStore
+from app.services.llm.base import StreamEvent
+from app.services.llm.caching import CachingProvider, LLMResponseCache, SemanticIndex
+from app.services.llm_service import LLMService
+
+
+class KeywordEmbedder:
+    async def embed(self, text: str) -> list[float]:
+        return [float("hello" in text), float("weather" in text), 1.0]
+
+
+def caching(inner: ScriptedProvider, **cache_options: Any) -> CachingProvider:
+    cache = LLMResponseCache(MemoryCacheBackend(max_entries=8), ttl_seconds=60, **cache_options)
+    return CachingProvider(inner, name="scripted", cache=cache, replay_chunk_chars=4)
+
+
+def test_exact_match_replays_in_chunks_without_calling_provider() -> None:
+    inner = ScriptedProvider(chunks=list("Hello there"))
+    provider = caching(inner)
+    first = collect(provider, "Say hello")
+    replay = collect(provider, "  say hello ".replace("say", "Say"))
+
+    assert inner.opened == 1
+    assert len(first) == 12
+    assert [event.text for event in replay[:-1]] == ["Hell", "o th", "ere"]
+    assert first[-1].response_id == "resp-1"
+    assert replay[-1] == StreamEvent(kind="done", response_id=None)
+
+
+def test_previous_response_id_bypasses_cache() -> None:
+    inner = ScriptedProvider(chunks=list("Hello there"))
+    provider = caching(inner)
+    collect(provider, "Say hello")
+    collect(provider, "Say hello", previous_response_id="resp-1")
+    assert inner.opened == 2
+
+
+def test_semantic_mode_reuses_similar_prompt_without_response_id() -> None:
+    inner = ScriptedProvider(chunks=list("Hello there"))
+    provider = caching(
+        inner, embedder=KeywordEmbedder(), semantic_index=SemanticIndex(8, threshold=0.99)
+    )
+    collect(provider, "hello friend")
+    similar = collect(provider, "hello, my friend")
+    collect(provider, "weather today")
+
+    assert inner.opened == 2
+    assert "".join(event.text or "" for event in similar) == "Hello there"
+    assert similar[-1].response_id is None
+
+
+def test_exact_hit_does_not_hand_out_another_callers_response_id(use_provider: Any) -> None:
+    inner = ScriptedProvider(chunks=["Hello"], stateful_responses=True)
+    use_provider(caching(inner))
+    service = LLMService(MemoryConversationStore(max_conversations=10, ttl_seconds=60))
+
+    async def turn(conversation_id: str, text: str, create: bool) -> None:
+        items = [{"role": "user", "content": text}]
+        async for _ in service.astream_conversation(conversation_id, "m", items, create=create):
+            pass
+
+    async def run() -> None:
+        await turn("alice", "Say hello", create=True)
+        await turn("bob", "Say hello", create=True)
+        await turn("bob", "And again", create=False)
+
+    asyncio.run(run())
+    assert inner.opened == 2
+    assert inner.calls[1]["previous_response_id"] is None
+    assert inner.calls[1]["input_items"] == [
+        {"role": "user", "content": "Say hello"},
+        {"role": "assistant", "content": "Hello"},
+        {"role": "user", "content": "And again"},
+    ]
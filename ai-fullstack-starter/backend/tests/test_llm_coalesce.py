@@ -0,0 +1,71 @@
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+
+from app.services.llm.base import StreamEvent
+from app.services.llm.coalesce import coalesce_deltas
+
+
+async def deltas(texts: list[str], pause: float = 0.0) -> AsyncIterator[StreamEvent]:
+    for text in texts:
+        if pause:
+            await asyncio.sleep(pause)
+        yield StreamEvent(kind="delta", text=text)
+    yield StreamEvent(kind="done", response_id="r")
+
+
+def collect(events: AsyncIterator[StreamEvent], **options: float) -> list[StreamEvent]:
+    async def run() -> list[StreamEvent]:
+        return [event async for event in coalesce_deltas(events, **options)]  # type: ignore[arg-type]
+
+    return asyncio.run(run())
+
+
+def test_first_delta_passes_through_and_rest_merge_by_size() -> None:
+    result = collect(deltas(list("abcdefg")), max_bytes=3, max_delay=10)
+    assert [event.text for event in result[:-1]] == ["a", "bcd", "efg"]
+    assert result[-1] == StreamEvent(kind="done", response_id="r")
+
+
+def test_pending_text_flushes_after_time_window() -> None:
+    result = collect(deltas(["a", "b", "c"], pause=0.05), max_bytes=1000, max_delay=0.01)
+    assert [event.text for event in result[:-1]] == ["a", "b", "c"]
+
+
+def test_upstream_error_is_raised_after_pending_text() -> None:
+    async def failing() -> AsyncIterator[StreamEvent]:
+        yield StreamEvent(kind="delta", text="a")
+        yield StreamEvent(kind="delta", text="b")
+        raise RuntimeError("upstream broke")
+
+    seen: list[str | None] = []
+
+    async def run() -> None:
+        async for event in coalesce_deltas(failing(), max_bytes=100, max_delay=10):
+            seen.append(event.text)
+
+    with pytest.raises(RuntimeError, match="upstream broke"):
+        asyncio.run(run())
+    # The first delta passes straight through; the pending "b" is flushed before the error.
+    assert seen == ["a", "b"]
+
+
+def test_closing_early_closes_upstream() -> None:
+    closed = asyncio.Event()
+
+    async def endless() -> AsyncIterator[StreamEvent]:
+        try:
+            while True:
+                yield StreamEvent(kind="delta", text="x")
+                await asyncio.sleep(0)
+        finally:
+            closed.set()
+
+    async def run() -> bool:
+        stream = coalesce_deltas(endless(), max_bytes=4, max_delay=10, buffer_events=2)
+        await anext(stream)
+        await stream.aclose()
+        return closed.is_set()
+
+    assert asyncio.run(run())
@@ -4,8 +4,8 @@ from app.main import app
 
 
 def test_llm_config_defaults() -> None:
-    client = TestClient(app)
-    response = client.get("/api/llm/config")
+    with TestClient(app) as client:
+        response = client.get("/api/llm/config")
     assert response.status_code == 200
     payload = response.json()
     assert payload["provider"] == "openai"
@@ -1,5 +1,18 @@
+import asyncio
+
+import pytest
+
 from app.core.config import settings
-from app.services.llm.factory import get_llm_provider
+from app.services.llm.factory import (
+    _registry,
+    close_llm_providers,
+    get_async_llm_provider,
+    get_llm_provider,
+    invalidate_llm_providers,
+    register_provider,
+)
+from app.services.llm.limiting import LimitedProvider
+from app.services.llm.threaded import ThreadedAsyncProvider
 
 
 def test_factory_selects_openai() -> None:
@@ -20,3 +33,132 @@ def test_factory_selects_gemini() -> None:
         assert provider.__class__.__name__ == "GeminiProvider"
     finally:
         settings.LLM_PROVIDER = previous
+
+
+def test_async_factory_prefers_native_async_provider(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "LLM_PROVIDER", "openai")
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "openai-key")
+    try:
+        provider = get_async_llm_provider()
+        assert isinstance(provider, LimitedProvider)
+        assert provider.inner.__class__.__name__ == "OpenAIProvider"
+        assert provider.stateful_responses
+    finally:
+        invalidate_llm_providers("openai")
+
+
+def test_async_factory_wraps_sync_only_provider() -> None:
+    class SyncOnlyProvider:
+        def stream_chat(self, *args: object, **kwargs: object) -> None:
+            raise NotImplementedError
+
+    previous = settings.LLM_PROVIDER
+    register_provider("sync-only", SyncOnlyProvider)  # type: ignore[arg-type]
+    settings.LLM_PROVIDER = "sync-only"
+    try:
+        provider = get_async_llm_provider()
+        assert isinstance(provider, LimitedProvider)
+        assert isinstance(provider.inner, ThreadedAsyncProvider)
+    finally:
+        settings.LLM_PROVIDER = previous
+        _registry.pop("sync-only", None)
+        invalidate_llm_providers("sync-only")
+
+
+def test_threaded_adapter_keeps_stateful_responses() -> None:
+    class StatefulSyncProvider:
+        stateful_responses = True
+
+        def stream_chat(self, *args: object, **kwargs: object) -> None:
+            raise NotImplementedError
+
+    provider = ThreadedAsyncProvider(StatefulSyncProvider())  # type: ignore[arg-type]
+    assert provider.stateful_responses
+
+
+def test_factory_reuses_instances_until_invalidated() -> None:
+    class ClosableProvider:
+        closed = 0
+
+        def stream_chat(self, *args: object, **kwargs: object) -> None:
+            raise NotImplementedError
+
+        async def aclose(self) -> None:
+            ClosableProvider.closed += 1
+
+    previous_provider, previous_model = settings.LLM_PROVIDER, settings.LLM_MODEL
+    register_provider("closable", ClosableProvider)  # type: ignore[arg-type]
+    settings.LLM_PROVIDER = "closable"
+    try:
+        first = get_llm_provider()
+        assert get_llm_provider() is first
+
+        settings.LLM_MODEL = "other-model"
+        assert get_llm_provider() is not first
+
+        invalidate_llm_providers("closable")
+        rebuilt = get_llm_provider()
+        assert rebuilt is not first
+
+        asyncio.run(close_llm_providers())
+        assert ClosableProvider.closed == 3
+        assert get_llm_provider() is not rebuilt
+    finally:
+        settings.LLM_PROVIDER, settings.LLM_MODEL = previous_provider, previous_model
+        _registry.pop("closable", None)
+        invalidate_llm_providers("closable")
+
+
+def test_factory_keys_instances_by_the_providers_own_model() -> None:
+    class OtherProvider:
+        def stream_chat(self, *args: object, **kwargs: object) -> None:
+            raise NotImplementedError
+
+    previous_provider, previous_model = settings.LLM_PROVIDER, settings.LLM_MODEL
+    register_provider("other", OtherProvider)  # type: ignore[arg-type]
+    settings.LLM_PROVIDER = "openai"
+    try:
+        first = get_llm_provider("other")
+        # LLM_MODEL only applies to the active provider, so "other" is unaffected.
+        settings.LLM_MODEL = "other-model"
+        assert get_llm_provider("other") is first
+    finally:
+        settings.LLM_PROVIDER, settings.LLM_MODEL = previous_provider, previous_model
+        _registry.pop("other", None)
+        invalidate_llm_providers("other")
+
+
+def test_factory_builds_router_over_configured_providers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "openai-key")
+    monkeypatch.setattr(settings, "GEMINI_API_KEY", "gemini-key")
+    previous = settings.LLM_PROVIDER, settings.LLM_ROUTER_PROVIDERS, settings.LLM_HEDGE_AFTER_MS
+    settings.LLM_PROVIDER = "router"
+    settings.LLM_ROUTER_PROVIDERS = "openai, gemini"
+    settings.LLM_HEDGE_AFTER_MS = 250
+    try:
+        router = get_async_llm_provider()
+        assert router.__class__.__name__ == "ConfiguredRoutingProvider"
+        assert get_async_llm_provider() is router
+        targets = router.targets  # type: ignore[attr-defined]
+        assert [(t.name, t.model) for t in targets] == [
+            ("openai", "gpt-4o-mini"),
+            ("gemini", "gemini-2.0-flash-exp"),
+        ]
+        assert router.hedge_after == 0.25  # type: ignore[attr-defined]
+        with pytest.raises(ValueError, match="async-only"):
+            get_llm_provider()
+    finally:
+        settings.LLM_PROVIDER, settings.LLM_ROUTER_PROVIDERS, settings.LLM_HEDGE_AFTER_MS = previous
+        invalidate_llm_providers("router")
+
+
+def test_router_skips_targets_without_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "LLM_PROVIDER", "router")
+    monkeypatch.setattr(settings, "LLM_ROUTER_PROVIDERS", "openai,gemini")
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "")
+    monkeypatch.setattr(settings, "GEMINI_API_KEY", "gemini-key")
+    try:
+        router = get_async_llm_provider()
+        assert [t.name for t in router.targets] == ["gemini"]  # type: ignore[attr-defined]
+    finally:
+        invalidate_llm_providers()
@@ -0,0 +1,127 @@
+import asyncio
+from typing import Any
+
+import pytest
+from conftest import ScriptedProvider, StatusError
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.services.llm.factory import get_async_llm_provider, invalidate_llm_providers
+from app.services.llm.limiting import LimitedProvider, LLMRateLimitError, ProviderLimiter
+
+
+async def consume(provider: LimitedProvider) -> None:
+    async with provider.astream_chat("m", [{"role": "user", "content": "hi"}]) as stream:
+        async for _ in stream:
+            pass
+
+
+def test_retries_429_and_5xx_with_backoff() -> None:
+    inner = ScriptedProvider(open_failures=[429, 503])
+    limiter = ProviderLimiter(max_concurrency=1, max_retries=2, backoff_seconds=0.001)
+    asyncio.run(consume(LimitedProvider(inner, limiter)))  # type: ignore[arg-type]
+    assert inner.opened == 3
+    assert limiter.stats.retries == 2
+    assert limiter.stats.in_flight == 0
+
+
+def test_does_not_retry_client_errors() -> None:
+    inner = ScriptedProvider(open_failures=[400])
+    limiter = ProviderLimiter(max_concurrency=1, backoff_seconds=0.001)
+    with pytest.raises(StatusError):
+        asyncio.run(consume(LimitedProvider(inner, limiter)))  # type: ignore[arg-type]
+    assert inner.opened == 1
+    assert limiter.stats.in_flight == 0
+
+
+def test_concurrency_is_bounded_and_queue_wait_rejects() -> None:
+    inner = ScriptedProvider(first_token_delay=0.05)
+    limiter = ProviderLimiter(max_concurrency=2, max_queue_wait=0.02)
+    provider = LimitedProvider(inner, limiter)  # type: ignore[arg-type]
+
+    async def run() -> list[BaseException | None]:
+        return await asyncio.gather(*(consume(provider) for _ in range(4)), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert inner.peak == 2
+    assert sum(isinstance(result, LLMRateLimitError) for result in results) == 2
+    assert limiter.stats.admitted == 2 and limiter.stats.rejected == 2
+
+
+def test_request_bucket_rejects_when_wait_exceeds_queue_limit() -> None:
+    limiter = ProviderLimiter(max_concurrency=10, requests_per_minute=2, max_queue_wait=0.1)
+    provider = LimitedProvider(ScriptedProvider(), limiter)  # type: ignore[arg-type]
+
+    async def run() -> None:
+        await consume(provider)
+        await consume(provider)
+        await consume(provider)
+
+    with pytest.raises(LLMRateLimitError):
+        asyncio.run(run())
+    assert limiter.stats.admitted == 2
+
+
+def test_failed_open_refunds_rate_budget() -> None:
+    inner = ScriptedProvider(open_failures=[400])
+    limiter = ProviderLimiter(max_concurrency=1, requests_per_minute=1, max_queue_wait=0.1)
+    provider = LimitedProvider(inner, limiter)  # type: ignore[arg-type]
+
+    async def run() -> None:
+        with pytest.raises(StatusError):
+            await consume(provider)
+        await consume(provider)
+
+    asyncio.run(run())
+    assert inner.opened == 2
+    assert limiter.stats.rejected == 0
+
+
+def test_limiter_is_reusable_across_event_loops() -> None:
+    inner = ScriptedProvider(first_token_delay=0.01)
+    limiter = ProviderLimiter(max_concurrency=1, max_queue_wait=1.0)
+    provider = LimitedProvider(inner, limiter)  # type: ignore[arg-type]
+
+    async def run() -> None:
+        await asyncio.gather(consume(provider), consume(provider))
+
+    asyncio.run(run())
+    asyncio.run(run())
+    assert inner.opened == 4 and inner.peak == 1
+
+
+def test_chat_route_reports_rate_limit_rejection(
+    use_provider: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "LLM_REQUESTS_PER_MINUTE", 1)
+    monkeypatch.setattr(settings, "LLM_QUEUE_MAX_WAIT_SECONDS", 0.1)
+    use_provider(ScriptedProvider())
+    body = {"messages": [{"role": "user", "content": "hi"}]}
+    with TestClient(app) as client:
+        client.post("/api/llm/chat/stream", json=body)
+        response = client.post("/api/llm/chat/stream", json=body)
+    assert response.text == (
+        "event: error\n"
+        'data: {"error": "LLM rate limit reached; try again later.", "code": "rate_limited"}\n\n'
+    )
+
+
+def test_limits_endpoint_reports_per_provider_stats(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+    invalidate_llm_providers()
+    get_async_llm_provider("openai")
+    with TestClient(app) as client:
+        response = client.get("/api/llm/limits")
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "provider": "openai",
+            "in_flight": 0,
+            "queued": 0,
+            "admitted": 0,
+            "rejected": 0,
+            "retries": 0,
+            "upstream_errors": 0,
+        }
+    ]
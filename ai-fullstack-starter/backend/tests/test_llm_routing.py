@@ -0,0 +1,50 @@
+from typing import Any
+
+import pytest
+from conftest import ScriptedProvider, collect
+
+from app.core.errors import UpstreamServiceError
+from app.services.llm.routing import RouteTarget, RoutingProvider
+
+
+def route(*providers: ScriptedProvider, **options: Any) -> RoutingProvider:
+    targets = [RouteTarget(name=p.name, provider=p, model="m") for p in providers]
+    return RoutingProvider(targets, **options)
+
+
+def texts(router: RoutingProvider) -> list[str | None]:
+    return [event.text for event in collect(router) if event.kind == "delta"]
+
+
+def test_fails_over_when_first_token_deadline_is_missed() -> None:
+    slow = ScriptedProvider("slow", first_token_delay=1.0)
+    fast = ScriptedProvider("fast")
+    assert texts(route(slow, fast, first_token_timeout=0.05)) == ["fast1"]
+    assert slow.closed == 1
+
+
+def test_fails_over_on_error_without_waiting_for_deadline() -> None:
+    broken = ScriptedProvider("broken", fail=True)
+    backup = ScriptedProvider("backup")
+    assert texts(route(broken, backup, first_token_timeout=5.0)) == ["backup1"]
+
+
+def test_hedge_keeps_the_stream_that_starts_first() -> None:
+    primary = ScriptedProvider("primary", first_token_delay=0.3)
+    hedge = ScriptedProvider("hedge")
+    router = route(primary, hedge, first_token_timeout=5.0, hedge_after=0.02)
+    assert texts(router) == ["hedge1"]
+    assert primary.opened == 1 and primary.closed == 1
+
+
+def test_no_hedge_when_primary_is_fast() -> None:
+    primary = ScriptedProvider("primary")
+    hedge = ScriptedProvider("hedge")
+    assert texts(route(primary, hedge, hedge_after=0.2)) == ["primary1"]
+    assert hedge.opened == 0
+
+
+def test_raises_when_every_provider_fails() -> None:
+    router = route(ScriptedProvider("a", fail=True), ScriptedProvider("b", fail=True))
+    with pytest.raises(UpstreamServiceError):
+        collect(router)
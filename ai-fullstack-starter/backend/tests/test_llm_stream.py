@@ -0,0 +1,122 @@
+import asyncio
+from typing import Any, Iterator
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.services.llm.base import StreamEvent
+from app.services.llm.factory import _registry, invalidate_llm_providers, register_provider
+from app.services.llm.gemini_provider import _AsyncGeminiStreamAdapter
+from app.services.llm_service import LLMService
+
+
+class FakeStream:
+    def __init__(self, chunks: list[str]) -> None:
+        self.chunks = chunks
+        self.exited = False
+
+    def __enter__(self) -> "FakeStream":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.exited = True
+
+    def __iter__(self) -> Iterator[StreamEvent]:
+        for chunk in self.chunks:
+            yield StreamEvent(kind="delta", text=chunk)
+        yield StreamEvent(kind="done", response_id="resp-1")
+
+
+class FakeProvider:
+    streams: list[FakeStream] = []
+
+    def stream_chat(
+        self,
+        model: str,
+        input_items: list[dict[str, Any]],
+        previous_response_id: str | None = None,
+    ) -> FakeStream:
+        stream = FakeStream(["Hel", "lo"])
+        FakeProvider.streams.append(stream)
+        return stream
+
+
+def with_fake_provider(test: Any) -> Any:
+    def wrapper() -> None:
+        previous = settings.LLM_PROVIDER
+        register_provider("fake", FakeProvider)  # type: ignore[arg-type]
+        settings.LLM_PROVIDER = "fake"
+        FakeProvider.streams = []
+        try:
+            test()
+        finally:
+            settings.LLM_PROVIDER = previous
+            _registry.pop("fake", None)
+            invalidate_llm_providers("fake")
+
+    return wrapper
+
+
+@with_fake_provider
+def test_chat_stream_sends_sse_events() -> None:
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/llm/chat/stream", json={"messages": [{"role": "user", "content": "Hi"}]}
+        )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == (
+        'event: delta\ndata: {"text": "Hel"}\n\n'
+        'event: delta\ndata: {"text": "lo"}\n\n'
+        'event: done\ndata: {"response_id": "resp-1"}\n\n'
+    )
+    assert FakeProvider.streams[0].exited
+
+
+@with_fake_provider
+def test_closing_async_stream_exits_provider_stream() -> None:
+    async def read_first() -> StreamEvent:
+        stream = LLMService().astream_chat("model", [{"role": "user", "content": "Hi"}])
+        first = await anext(stream)
+        await stream.aclose()
+        return first
+
+    first = asyncio.run(read_first())
+    assert first.text == "Hel"
+    assert FakeProvider.streams[0].exited
+
+
+def test_gemini_adapter_closes_response_on_early_exit() -> None:
+    closed: list[str] = []
+
+    class FakeResponse:
+        def __init__(self) -> None:
+            self._iterator = self.upstream()
+
+        async def upstream(self) -> Any:
+            try:
+                while True:
+                    yield "chunk"
+            finally:
+                closed.append("upstream")
+
+        async def __aiter__(self) -> Any:
+            try:
+                async for text in self._iterator:
+                    yield type("Chunk", (), {"text": text})()
+            finally:
+                closed.append("chunks")
+
+    async def open_stream() -> FakeResponse:
+        return FakeResponse()
+
+    async def read_first() -> StreamEvent:
+        async with _AsyncGeminiStreamAdapter(open_stream) as stream:
+            async for event in stream:
+                return event
+        raise AssertionError("stream ended early")
+
+    first = asyncio.run(read_first())
+    assert first.text == "chunk"
+    assert sorted(closed) == ["chunks", "upstream"]
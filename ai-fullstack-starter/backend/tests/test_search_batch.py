@@ -0,0 +1,34 @@
+import httpx
+from fastapi.testclient import TestClient
+
+from app.core.http_clients import HttpClientRegistry
+from app.main import app
+
+
+def test_batch_keeps_order_and_reports_errors_per_query() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["srsearch"]
+        if query == "broken":
+            return httpx.Response(503)
+        return httpx.Response(200, json={"query": {"search": [{"title": query.title()}]}})
+
+    registry = HttpClientRegistry(
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    with TestClient(app) as client, app.state.container.override(http_clients=registry):
+        response = client.post(
+            "/api/search/batch", json={"queries": ["alpha", "broken", "gamma"]}
+        )
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["query"] for item in items] == ["alpha", "broken", "gamma"]
+    assert items[0]["results"][0]["title"] == "Alpha"
+    assert items[1]["error"] and items[1]["results"] == []
+    assert items[2]["error"] is None
+
+
+def test_batch_rejects_empty_query_list() -> None:
+    with TestClient(app) as client:
+        response = client.post("/api/search/batch", json={"queries": []})
+    assert response.status_code == 422
@@ -0,0 +1,58 @@
+import asyncio
+
+from app.core.cache import MemoryCacheBackend, ResponseCache
+
+
+def test_memory_backend_evicts_least_recently_used() -> None:
+    async def scenario() -> None:
+        backend = MemoryCacheBackend(max_entries=2)
+        await backend.set("a", 1, ttl_seconds=60)
+        await backend.set("b", 2, ttl_seconds=60)
+        assert await backend.get("a") == 1
+        await backend.set("c", 3, ttl_seconds=60)
+        assert await backend.get("b") is None
+        assert await backend.get("a") == 1
+        await backend.set("d", 4, ttl_seconds=0)
+        assert await backend.get("d") is None
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_misses_share_one_load() -> None:
+    calls = 0
+
+    async def loader() -> list[str]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return ["result"]
+
+    async def scenario() -> ResponseCache:
+        cache = ResponseCache(MemoryCacheBackend(max_entries=10), ttl_seconds=60)
+        results = await asyncio.gather(*(cache.get_or_load("q", loader) for _ in range(5)))
+        assert results == [["result"]] * 5
+        assert await cache.get_or_load("q", loader) == ["result"]
+        return cache
+
+    cache = asyncio.run(scenario())
+    assert calls == 1
+    assert (cache.stats.misses, cache.stats.coalesced, cache.stats.hits) == (1, 4, 1)
+
+
+def test_cancelled_caller_does_not_cancel_shared_load() -> None:
+    async def loader() -> list[str]:
+        await asyncio.sleep(0.02)
+        return ["result"]
+
+    async def scenario() -> None:
+        cache = ResponseCache(MemoryCacheBackend(max_entries=10), ttl_seconds=60)
+        first = asyncio.create_task(cache.get_or_load("q", loader))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.get_or_load("q", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == ["result"]
+        assert first.cancelled()
+        assert await cache.backend.get("q") == ["result"]
+
+    asyncio.run(scenario())
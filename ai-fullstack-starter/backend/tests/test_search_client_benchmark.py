@@ -0,0 +1,117 @@
+"""Benchmark harness for search clients.
+
+Every registered client is run against a local stub HTTP server that answers in
+that client's upstream format, and p50/p99 latency and throughput are reported.
+Run with ``uv run pytest -m benchmark -s``; ``SEARCH_BENCH_REQUESTS`` and
+``SEARCH_BENCH_CONCURRENCY`` scale the run.
+"""
+import asyncio
+import json
+import os
+import statistics
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import httpx
+import pytest
+
+from app.clients.wikipedia_client import WikipediaClient
+from app.core.protocols import SearchClientProtocol
+
+pytestmark = pytest.mark.benchmark
+
+REQUESTS = int(os.environ.get("SEARCH_BENCH_REQUESTS", "200"))
+CONCURRENCY = int(os.environ.get("SEARCH_BENCH_CONCURRENCY", "20"))
+
+
+@dataclass
+class BenchmarkTarget:
+    factory: Callable[[httpx.AsyncClient, str], SearchClientProtocol]
+    payload: dict[str, Any]
+
+
+def _wikipedia(http_client: httpx.AsyncClient, base_url: str) -> SearchClientProtocol:
+    client = WikipediaClient(http_client=http_client)
+    client.base_url = base_url
+    return client
+
+
+# Register new search clients here so every change to them comes with numbers.
+TARGETS: dict[str, BenchmarkTarget] = {
+    "wikipedia": BenchmarkTarget(
+        factory=_wikipedia,
+        payload={"query": {"search": [{"title": f"Result {i}"} for i in range(5)]}},
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def stub_server() -> Iterator[tuple[str, dict[str, bytes]]]:
+    bodies: dict[str, bytes] = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            body = bodies[self.path.split("?", 1)[0].strip("/")]
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", bodies
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _report(name: str, latencies: list[float], elapsed: float) -> str:
+    cuts = statistics.quantiles(latencies, n=100)
+    return (
+        f"{name}: n={len(latencies)} p50={cuts[49] * 1000:.2f}ms "
+        f"p99={cuts[98] * 1000:.2f}ms throughput={len(latencies) / elapsed:.0f} req/s"
+    )
+
+
+@pytest.mark.parametrize("name", sorted(TARGETS))
+def test_search_client_benchmark(name: str, stub_server: tuple[str, dict[str, bytes]]) -> None:
+    base_url, bodies = stub_server
+    target = TARGETS[name]
+    bodies[name] = json.dumps(target.payload).encode("utf-8")
+
+    async def run() -> tuple[list[float], float, list[list[dict[str, str]]]]:
+        limits = httpx.Limits(max_connections=CONCURRENCY)
+        async with httpx.AsyncClient(limits=limits) as http_client:
+            client = target.factory(http_client, f"{base_url}/{name}")
+            semaphore = asyncio.Semaphore(CONCURRENCY)
+            latencies: list[float] = []
+
+            async def one(i: int) -> None:
+                async with semaphore:
+                    started = time.perf_counter()
+                    results = await client.search(f"query {i}")
+                    latencies.append(time.perf_counter() - started)
+                    assert results, "client returned no results from the stub"
+
+            started = time.perf_counter()
+            await asyncio.gather(*(one(i) for i in range(REQUESTS)))
+            elapsed = time.perf_counter() - started
+            batch = await client.search_many(["a", "b", "c"])
+            return latencies, elapsed, batch
+
+    latencies, elapsed, batch = asyncio.run(run())
+    print(_report(name, latencies, elapsed))
+    assert len(latencies) == REQUESTS
+    assert len(batch) == 3 and all(batch)
@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from app.core.errors import UpstreamServiceError
+from app.services.search_service import SearchService
+
+
+class FakeClient:
+    def __init__(self, name: str, urls: list[str], delay: float = 0.0) -> None:
+        self.name = name
+        self.urls = urls
+        self.delay = delay
+
+    async def search(self, query: str) -> list[dict[str, str]]:
+        await asyncio.sleep(self.delay)
+        return [{"title": url, "url": url, "source": self.name} for url in self.urls]
+
+
+class FailingClient:
+    name = "broken"
+
+    async def search(self, query: str) -> list[dict[str, str]]:
+        raise RuntimeError("upstream down")
+
+
+def test_merges_and_ranks_by_url() -> None:
+    service = SearchService(
+        clients=[
+            FakeClient("a", ["https://x.test/1", "https://x.test/2"]),
+            FakeClient("b", ["https://x.test/2/", "https://x.test/3"]),
+        ]
+    )
+    results = asyncio.run(service.search("query"))
+    assert [item["url"] for item in results] == [
+        "https://x.test/2",
+        "https://x.test/1",
+        "https://x.test/3",
+    ]
+
+
+def test_url_paths_stay_case_sensitive_when_merging() -> None:
+    service = SearchService(
+        clients=[
+            FakeClient("a", ["https://en.wikipedia.org/wiki/Go"]),
+            FakeClient("b", ["HTTPS://EN.Wikipedia.org/wiki/Go", "https://en.wikipedia.org/wiki/GO"]),
+        ]
+    )
+    results = asyncio.run(service.search("query"))
+    assert [item["url"] for item in results] == [
+        "https://en.wikipedia.org/wiki/Go",
+        "https://en.wikipedia.org/wiki/GO",
+    ]
+
+
+def test_slow_and_failing_sources_are_dropped_at_deadline() -> None:
+    service = SearchService(
+        clients=[
+            FakeClient("fast", ["https://x.test/fast"]),
+            FakeClient("slow", ["https://x.test/slow"], delay=5),
+            FailingClient(),
+        ],
+        deadline_seconds=0.05,
+    )
+    results = asyncio.run(service.search("query"))
+    assert [item["source"] for item in results] == ["fast"]
+
+
+def test_raises_when_no_source_answers() -> None:
+    service = SearchService(clients=[FailingClient()])
+    with pytest.raises(UpstreamServiceError):
+        asyncio.run(service.search("query"))
+
+
+def test_cancelling_search_cancels_source_requests() -> None:
+    started = asyncio.Event()
+    cancelled: list[str] = []
+
+    class HangingClient:
+        name = "hanging"
+
+        async def search(self, query: str) -> list[dict[str, str]]:
+            started.set()
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(self.name)
+                raise
+            return []
+
+    async def scenario() -> None:
+        service = SearchService(clients=[HangingClient()], deadline_seconds=5)
+        search = asyncio.create_task(service.search("query"))
+        await started.wait()
+        search.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await search
+        assert cancelled == ["hanging"]
+
+    asyncio.run(scenario())
@@ -4,13 +4,89 @@
 from __future__ import annotations
 
 import argparse
+import codecs
 import datetime as dt
+import difflib
 import hashlib
 import json
+import mmap
+import os
 import re
+import shutil
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+try:
+    import yaml
+except ImportError:  # PyYAML is only needed for YAML batch specs.
+    yaml = None
+
+DEFAULT_TEMPLATE = "fullstack-app"
+DEFAULT_DESCRIPTION = "Full-stack app with Python backend and Next.js frontend."
+DEFAULT_PYTHON = ">=3.11"
+DEFAULT_LICENSE = "MIT"
 
 TOKEN_RE = re.compile(r"{{\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*}}")
+# Matches a trailing, possibly incomplete token at the end of a chunk.
+TOKEN_PREFIX_RE = re.compile(r"\{(?:\{\s*(?:[a-zA-Z_][a-zA-Z0-9_]*\s*\}?)?)?\Z")
+MANIFEST_VERSION = 2
+COMPILE_CACHE_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+# Template files larger than this are rendered chunk by chunk instead of in memory.
+STREAM_THRESHOLD_BYTES = 4 * 1024 * 1024
+BINARY_SNIFF_BYTES = 8192
+STAT_CACHE_VERSION = 1
+# Files modified this recently are re-hashed on the next run, because a later
+# write within the filesystem timestamp granularity would keep the same mtime.
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+PACK_SUFFIX = ".tpack"
+PACK_MAGIC = b"SCAFPACK"
+PACK_VERSION = 1
+# magic, format version, length of the JSON index that follows
+PACK_HEADER = struct.Struct("<8sII")
+IGNORE_FILE_NAMES = (".gitignore",)
+# Read at the project root only; every pattern is anchored there, as Docker does.
+ROOT_ANCHORED_IGNORE_FILES = (".dockerignore",)
+ALWAYS_PRUNED_DIRS = {".git"}
+
+
+@dataclass
+class PackMember:
+    """A file stored in a template pack, read through a shared read-only mmap."""
+
+    pack: Path
+    offset: int
+    size: int
+    sha256: str
+
+    def view(self) -> memoryview:
+        return memoryview(pack_map(self.pack))[self.offset : self.offset + self.size]
+
+
+TemplateSource = Path | PackMember
+
+
+@dataclass
+class TemplateEntry:
+    """One file or directory of a compiled template.
+
+    ``kind`` is ``"dir"``, ``"text"`` (compiled in memory), ``"stream"`` (large
+    text rendered chunk by chunk from ``source``) or ``"binary"`` (copied
+    byte-for-byte from ``source``).
+    """
+
+    relative: str
+    path_segments: list[str]
+    kind: str = "text"
+    segments: list[str] | None = None
+    digest: str = ""  # SHA-256 of the template file; empty for directories
+    source: TemplateSource | None = None
+    variables: list[str] = field(default_factory=list)  # names used by "stream" entries
 
 
 def slugify(value: str) -> str:
@@ -27,14 +103,380 @@ def to_package_name(value: str) -> str:
     return candidate
 
 
-def render_text(text: str, context: dict[str, str]) -> str:
-    def replacement(match: re.Match[str]) -> str:
-        key = match.group(1)
+def compile_text(text: str) -> list[str]:
+    """Split text into alternating literal and variable-name segments.
+
+    Even indices hold literal text and odd indices hold variable names, so
+    rendering is a lookup per variable followed by a single join.
+    """
+    return TOKEN_RE.split(text)
+
+
+def render_compiled(segments: list[str], context: dict[str, str]) -> str:
+    if len(segments) == 1:
+        return segments[0]
+    parts = segments.copy()
+    for index in range(1, len(parts), 2):
+        key = parts[index]
         if key not in context:
             raise KeyError(f"Missing template variable: {key}")
-        return context[key]
+        parts[index] = context[key]
+    return "".join(parts)
+
+
+def render_text(text: str, context: dict[str, str]) -> str:
+    return render_compiled(compile_text(text), context)
+
+
+def source_size(source: TemplateSource) -> int:
+    return source.size if isinstance(source, PackMember) else source.stat().st_size
+
+
+def read_source_bytes(source: TemplateSource, limit: int | None = None) -> bytes:
+    if isinstance(source, PackMember):
+        view = source.view()
+        return bytes(view if limit is None else view[:limit])
+    if limit is None:
+        return source.read_bytes()
+    with source.open("rb") as handle:
+        return handle.read(limit)
+
+
+def copy_source(source: TemplateSource, target: Path) -> None:
+    if isinstance(source, PackMember):
+        target.write_bytes(source.view())
+    else:
+        # copyfile uses sendfile/copy_file_range where the platform has them.
+        shutil.copyfile(source, target)
+
+
+def iter_source_text(source: TemplateSource) -> Iterator[str]:
+    """Yield a UTF-8 template file as decoded text chunks."""
+    if isinstance(source, PackMember):
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        view = source.view()
+        for start in range(0, len(view), HASH_CHUNK_SIZE):
+            if text := decoder.decode(view[start : start + HASH_CHUNK_SIZE]):
+                yield text
+        if tail := decoder.decode(b"", final=True):
+            yield tail
+        return
+    with source.open("r", encoding="utf-8", newline="") as handle:
+        while chunk := handle.read(HASH_CHUNK_SIZE):
+            yield chunk
+
+
+def iter_stream_segments(chunks: Iterable[str]) -> Iterator[list[str]]:
+    """Yield compiled segments for text that arrives in chunks.
+
+    A trailing partial ``{{ token }}`` is carried over to the next chunk, so
+    markers spanning chunk boundaries render exactly as they would in memory.
+    """
+    carry = ""
+    for chunk in chunks:
+        buffer = carry + chunk
+        match = TOKEN_PREFIX_RE.search(buffer)
+        cut = match.start() if match else len(buffer)
+        carry = buffer[cut:]
+        if cut:
+            yield compile_text(buffer[:cut])
+    if carry:
+        yield compile_text(carry)
+
+
+def render_stream(source: TemplateSource, target: Path, context: dict[str, str]) -> str:
+    digest = hashlib.sha256()
+    with target.open("wb") as out:
+        for segments in iter_stream_segments(iter_source_text(source)):
+            data = render_compiled(segments, context).encode("utf-8")
+            digest.update(data)
+            out.write(data)
+    return digest.hexdigest()
+
+
+def stream_sha256(source: TemplateSource, context: dict[str, str]) -> str:
+    """SHA-256 of what ``render_stream`` would write, without writing anything."""
+    digest = hashlib.sha256()
+    for segments in iter_stream_segments(iter_source_text(source)):
+        digest.update(render_compiled(segments, context).encode("utf-8"))
+    return digest.hexdigest()
+
 
-    return TOKEN_RE.sub(replacement, text)
+def compile_bytes(raw: bytes) -> list[str] | dict[str, Any]:
+    if b"\0" in raw[:BINARY_SNIFF_BYTES]:
+        return {"kind": "binary"}
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return {"kind": "binary"}
+    return compile_text(text)
+
+
+def compile_stream(source: TemplateSource) -> dict[str, Any]:
+    if b"\0" in read_source_bytes(source, BINARY_SNIFF_BYTES):
+        return {"kind": "binary"}
+    names: set[str] = set()
+    try:
+        for segments in iter_stream_segments(iter_source_text(source)):
+            names.update(segments[1::2])
+    except UnicodeDecodeError:
+        return {"kind": "binary"}
+    return {"kind": "stream", "variables": sorted(names)}
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "python-template-scaffolder"
+
+
+def load_compile_cache(cache_path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != COMPILE_CACHE_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def save_compile_cache(cache_path: Path, files: dict[str, Any]) -> None:
+    # The cache is an optimization only; failing to write it must not fail a create.
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        payload = {"version": COMPILE_CACHE_VERSION, "files": files}
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def default_templates_dir() -> Path:
+    return Path(__file__).resolve().parent / "templates"
+
+
+def list_templates(templates_dir: Path) -> list[str]:
+    names = {p.name for p in templates_dir.iterdir() if p.is_dir()}
+    names.update(p.name[: -len(PACK_SUFFIX)] for p in templates_dir.glob(f"*{PACK_SUFFIX}"))
+    return sorted(names)
+
+
+def resolve_template_root(templates_dir: Path, template_name: str) -> Path:
+    template_root = templates_dir / template_name
+    if not template_root.exists() or not template_root.is_dir():
+        available = list_templates(templates_dir)
+        raise FileNotFoundError(
+            f"Template '{template_name}' not found. Available templates: {', '.join(available)}"
+        )
+    return template_root
+
+
+_pack_maps: dict[Path, mmap.mmap] = {}
+
+
+def pack_map(pack_path: Path) -> mmap.mmap:
+    """Map a template pack once per process and reuse the mapping."""
+    mapped = _pack_maps.get(pack_path)
+    if mapped is None:
+        with pack_path.open("rb") as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        _pack_maps[pack_path] = mapped
+    return mapped
+
+
+def iter_pack_sources(pack_path: Path) -> Iterator[tuple[str, PackMember | None]]:
+    mapped = pack_map(pack_path)
+    if len(mapped) < PACK_HEADER.size:
+        raise ValueError(f"{pack_path} is not a template pack.")
+    magic, version, index_size = PACK_HEADER.unpack_from(mapped, 0)
+    if magic != PACK_MAGIC:
+        raise ValueError(f"{pack_path} is not a template pack.")
+    if version != PACK_VERSION:
+        raise ValueError(f"{pack_path} uses unsupported pack version {version}.")
+    data_start = PACK_HEADER.size + index_size
+    if data_start > len(mapped):
+        raise ValueError(f"{pack_path} is truncated: index extends past the end of the file.")
+    index = json.loads(mapped[PACK_HEADER.size : data_start])
+    for item in index["files"]:
+        if item["kind"] == "dir":
+            yield item["path"], None
+            continue
+        offset = data_start + item["offset"]
+        # A short or corrupt pack must not be read as silently truncated files.
+        if item["offset"] < 0 or item["size"] < 0 or offset + item["size"] > len(mapped):
+            raise ValueError(f"{pack_path} is truncated: {item['path']} is out of range.")
+        yield item["path"], PackMember(pack_path, offset, item["size"], item["sha256"])
+
+
+def iter_template_sources(
+    templates_dir: Path, template_name: str
+) -> Iterator[tuple[str, TemplateSource | None]]:
+    """Yield (relative path, source) in sorted order; source is None for directories.
+
+    A template directory takes precedence over a ``<name>.tpack`` pack.
+    """
+    pack_path = templates_dir / f"{template_name}{PACK_SUFFIX}"
+    if not (templates_dir / template_name).is_dir() and pack_path.is_file():
+        yield from iter_pack_sources(pack_path.resolve())
+        return
+
+    template_root = resolve_template_root(templates_dir, template_name)
+    for source in sorted(template_root.rglob("*")):
+        if source.name == ".DS_Store":
+            continue
+        relative = source.relative_to(template_root).as_posix()
+        yield relative, None if source.is_dir() else source
+
+
+def pack_template(templates_dir: Path, template_name: str, output: Path) -> int:
+    """Write a template directory to a single indexed pack file.
+
+    The pack is a fixed header, a JSON index of paths, offsets, sizes and
+    SHA-256 digests, then the file contents back to back.
+    """
+    template_root = resolve_template_root(templates_dir, template_name)
+    index: list[dict[str, Any]] = []
+    files: list[Path] = []
+    offset = 0
+    for relative, source in iter_template_sources(templates_dir, template_name):
+        if source is None:
+            index.append({"path": relative, "kind": "dir"})
+            continue
+        assert isinstance(source, Path)
+        size = source.stat().st_size
+        index.append(
+            {
+                "path": relative,
+                "kind": "file",
+                "offset": offset,
+                "size": size,
+                "sha256": file_sha256(source),
+            }
+        )
+        files.append(source)
+        offset += size
+
+    payload = json.dumps(
+        {"template": template_root.name, "files": index}, separators=(",", ":")
+    ).encode("utf-8")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_name(f"{output.name}.{os.getpid()}.tmp")
+    with tmp_path.open("wb") as out:
+        out.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(payload)))
+        out.write(payload)
+        for source in files:
+            with source.open("rb") as handle:
+                shutil.copyfileobj(handle, out, HASH_CHUNK_SIZE)
+    os.replace(tmp_path, output)
+    return len(files)
+
+
+def compile_template(
+    templates_dir: Path,
+    template_name: str,
+    cache_dir: Path | None = None,
+) -> list[TemplateEntry]:
+    """Parse every file of a template once into literal/variable segments.
+
+    Compiled file bodies are cached on disk keyed by the SHA-256 of the
+    template file, so later runs skip parsing for unchanged files. Large text
+    files are only scanned for variable names and binary files are only
+    hashed; both are read from the template again at render time.
+    """
+    cache_path = cache_dir / f"{template_name}.json" if cache_dir is not None else None
+    cached = load_compile_cache(cache_path) if cache_path is not None else {}
+    used: dict[str, Any] = {}
+    entries: list[TemplateEntry] = []
+
+    for relative, source in iter_template_sources(templates_dir, template_name):
+        path_segments = compile_text(relative)
+        if source is None:
+            entries.append(TemplateEntry(relative, path_segments, kind="dir"))
+            continue
+
+        compiled: list[str] | dict[str, Any] | None
+        if isinstance(source, PackMember):
+            # Packs record each file's digest, so cache hits need no content reads.
+            digest = source.sha256
+            compiled = cached.get(digest)
+            if source.size > STREAM_THRESHOLD_BYTES:
+                if not isinstance(compiled, dict):
+                    compiled = compile_stream(source)
+            elif compiled is None:
+                compiled = compile_bytes(read_source_bytes(source))
+        elif source.stat().st_size > STREAM_THRESHOLD_BYTES:
+            digest = file_sha256(source)
+            compiled = cached.get(digest)
+            if not isinstance(compiled, dict):
+                compiled = compile_stream(source)
+        else:
+            raw = source.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            compiled = cached.get(digest)
+            if compiled is None:
+                compiled = compile_bytes(raw)
+        used[digest] = compiled
+
+        if isinstance(compiled, list):
+            entries.append(TemplateEntry(relative, path_segments, segments=compiled, digest=digest))
+        else:
+            entries.append(
+                TemplateEntry(
+                    relative,
+                    path_segments,
+                    kind=compiled["kind"],
+                    digest=digest,
+                    source=source,
+                    variables=list(compiled.get("variables", [])),
+                )
+            )
+
+    if cache_path is not None and used.keys() != cached.keys():
+        save_compile_cache(cache_path, used)
+    return entries
+
+
+def template_digest(entries: list[TemplateEntry]) -> str:
+    """Merkle digest of a compiled template.
+
+    Each directory hashes the sorted names, kinds and digests of its children,
+    so two templates share a digest only if their trees are identical.
+    """
+    by_relative = {entry.relative: entry for entry in entries}
+    children: dict[str, list[str]] = {"": []}
+    for entry in entries:
+        parent = entry.relative.rpartition("/")[0]
+        children.setdefault(parent, []).append(entry.relative)
+
+    def node_digest(relative: str) -> str:
+        entry = by_relative.get(relative)
+        if entry is not None and entry.kind != "dir":
+            return entry.digest
+        digest = hashlib.sha256()
+        for child in sorted(children.get(relative, [])):
+            kind = "dir" if by_relative[child].kind == "dir" else "file"
+            name = child.rpartition("/")[2]
+            digest.update(f"{kind} {name} {node_digest(child)}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    return node_digest("")
+
+
+def template_variables(entries: list[TemplateEntry]) -> set[str]:
+    names: set[str] = set()
+    for entry in entries:
+        names.update(entry.path_segments[1::2])
+        if entry.segments is not None:
+            names.update(entry.segments[1::2])
+        names.update(entry.variables)
+    return names
+
+
+def check_context(entries: list[TemplateEntry], context: dict[str, str]) -> None:
+    missing = sorted(template_variables(entries) - context.keys())
+    if missing:
+        raise KeyError(f"Missing template variable: {', '.join(missing)}")
 
 
 def parse_vars(values: list[str]) -> dict[str, str]:
@@ -51,68 +493,337 @@ def parse_vars(values: list[str]) -> dict[str, str]:
 
 
 def file_sha256(path: Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
-def write_manifest(destination: Path, template_name: str, files: dict[str, str]) -> None:
+def write_manifest(
+    destination: Path,
+    template_name: str,
+    files: dict[str, str],
+    context: dict[str, str],
+    template_digest: str,
+) -> None:
     scaffold_dir = destination / ".scaffold"
     scaffold_dir.mkdir(parents=True, exist_ok=True)
     manifest_path = scaffold_dir / "manifest.json"
     manifest = {
-        "manifest_version": 1,
+        "manifest_version": MANIFEST_VERSION,
         "template": template_name,
+        "template_digest": template_digest,
+        "context": context,
         "generated_at": dt.datetime.now(dt.timezone.utc).isoformat(),
         "files": files,
     }
     manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
 
+def rendered_path(entry: TemplateEntry, context: dict[str, str]) -> str:
+    rel = render_compiled(entry.path_segments, context)
+    if entry.kind != "dir" and rel.endswith(".tmpl"):
+        rel = rel[: -len(".tmpl")]
+    return rel
+
+
+def write_entry(entry: TemplateEntry, context: dict[str, str], *targets: Path) -> str:
+    """Render one template file to every target and return the SHA-256 written."""
+    if entry.kind == "text":
+        data = render_compiled(entry.segments or [], context).encode("utf-8")
+        for target in targets:
+            target.write_bytes(data)
+        return hashlib.sha256(data).hexdigest()
+
+    if entry.source is None:
+        raise ValueError(f"Template entry {entry.relative} has no source file.")
+    if entry.kind == "binary":
+        for target in targets:
+            copy_source(entry.source, target)
+        return entry.digest
+
+    first, *rest = targets
+    digest = render_stream(entry.source, first, context)
+    for target in rest:
+        shutil.copyfile(first, target)
+    return digest
+
+
 def scaffold_project(
     templates_dir: Path,
     template_name: str,
     destination: Path,
     context: dict[str, str],
     overwrite: bool = False,
+    cache_dir: Path | None = None,
+    jobs: int = 1,
+    entries: list[TemplateEntry] | None = None,
 ) -> dict[str, str]:
-    template_root = templates_dir / template_name
-    if not template_root.exists() or not template_root.is_dir():
-        available = sorted(p.name for p in templates_dir.iterdir() if p.is_dir())
-        raise FileNotFoundError(
-            f"Template '{template_name}' not found. Available templates: {', '.join(available)}"
-        )
+    if entries is None:
+        entries = compile_template(templates_dir, template_name, cache_dir=cache_dir)
+    check_context(entries, context)
 
     destination.mkdir(parents=True, exist_ok=True)
-    generated_files: dict[str, str] = {}
-
-    for source in template_root.rglob("*"):
-        if source.name == ".DS_Store":
-            continue
+    base_dir = destination / ".scaffold" / "base"
+    planned: list[tuple[str, Path, TemplateEntry]] = []
+    sources: dict[str, str] = {}
 
-        relative = source.relative_to(template_root)
-        rendered_relative = Path(render_text(relative.as_posix(), context))
-        target = destination / rendered_relative
+    # Walk and create directories serially so conflicts are reported before any
+    # file is written and the layout does not depend on worker scheduling.
+    for entry in entries:
+        rel = rendered_path(entry, context)
+        target = destination / rel
 
-        if source.is_dir():
+        if entry.kind == "dir":
             target.mkdir(parents=True, exist_ok=True)
             continue
 
-        if target.suffix == ".tmpl":
-            target = target.with_suffix("")
+        # Two entries rendering to one path (a.tmpl and a) would race in the pool.
+        if rel in sources:
+            raise ValueError(
+                f"Template files {sources[rel]} and {entry.relative} both render to {rel}."
+            )
+        sources[rel] = entry.relative
 
         if target.exists() and not overwrite:
             raise FileExistsError(f"File exists: {target}. Use --overwrite to replace.")
 
         target.parent.mkdir(parents=True, exist_ok=True)
-        text = source.read_text(encoding="utf-8")
-        rendered = render_text(text, context)
-        target.write_text(rendered, encoding="utf-8")
-        rel = target.relative_to(destination).as_posix()
-        generated_files[rel] = file_sha256(target)
+        (base_dir / rel).parent.mkdir(parents=True, exist_ok=True)
+        planned.append((rel, target, entry))
+
+    def write_file(item: tuple[str, Path, TemplateEntry]) -> str:
+        rel, target, entry = item
+        # The pristine copy under .scaffold/base is the merge base for `update`.
+        return write_entry(entry, context, target, base_dir / rel)
+
+    if jobs > 1 and len(planned) > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            hashes = list(pool.map(write_file, planned))
+    else:
+        hashes = [write_file(item) for item in planned]
+
+    return {rel: digest for (rel, _, _), digest in zip(planned, hashes)}
+
+
+@dataclass
+class IgnoreRule:
+    """One gitignore-style pattern, scoped to the directory that declared it."""
+
+    base: str
+    regex: re.Pattern[str]
+    negate: bool
+    dir_only: bool
+
+
+def ignore_pattern_regex(pattern: str) -> str:
+    out: list[str] = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 2 :]:
+            end = pattern.index("]", i + 2)
+            body = pattern[i + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = end + 1
+        elif pattern[i] == "\\" and i + 1 < len(pattern):
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(out)
+
+
+def parse_ignore_file(path: Path, base: str, root_anchored: bool = False) -> list[IgnoreRule]:
+    """Parse a .gitignore-syntax file; missing or unreadable files yield no rules.
+
+    With ``root_anchored`` every pattern is relative to ``base`` (.dockerignore
+    semantics) instead of bare names matching at any depth.
+    """
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return []
+
+    rules: list[IgnoreRule] = []
+    for line in lines:
+        pattern = line.rstrip()
+        if not pattern or pattern.startswith("#"):
+            continue
+        negate = pattern.startswith("!")
+        if negate:
+            pattern = pattern[1:]
+        dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        if not pattern:
+            continue
+        # Patterns containing a slash are relative to the declaring directory;
+        # bare names match at any depth below it.
+        anchored = root_anchored or "/" in pattern
+        regex = ignore_pattern_regex(pattern.lstrip("/"))
+        if not anchored:
+            regex = f"(?:.*/)?{regex}"
+        rules.append(IgnoreRule(base, re.compile(regex), negate, dir_only))
+    return rules
+
+
+def is_ignored(rules: list[IgnoreRule], rel: str, is_dir: bool) -> bool:
+    ignored = False
+    for rule in rules:
+        if rule.dir_only and not is_dir:
+            continue
+        if rule.base:
+            if not rel.startswith(f"{rule.base}/"):
+                continue
+            candidate = rel[len(rule.base) + 1 :]
+        else:
+            candidate = rel
+        if rule.regex.fullmatch(candidate):
+            ignored = not rule.negate
+    return ignored
+
+
+def iter_project_files(project_path: Path, exclude: set[str] | None = None) -> Iterator[str]:
+    """Yield project-relative file paths, pruning ignored directories.
+
+    Honors .gitignore in every directory, plus .dockerignore (root-anchored)
+    and .scaffold/ignore at the project root; directories whose relative path is
+    in ``exclude`` are skipped as well. Entries are yielded as they are
+    found, sorted by name within each directory.
+    """
+    root_rules: list[IgnoreRule] = []
+    for name in IGNORE_FILE_NAMES:
+        root_rules += parse_ignore_file(project_path / name, "")
+    for name in ROOT_ANCHORED_IGNORE_FILES:
+        root_rules += parse_ignore_file(project_path / name, "", root_anchored=True)
+    root_rules += parse_ignore_file(project_path / ".scaffold" / "ignore", "")
+    yield from _walk_project_dir(project_path, "", root_rules, exclude or set())
+
+
+def _walk_project_dir(
+    directory: Path,
+    rel_dir: str,
+    rules: list[IgnoreRule],
+    exclude: set[str],
+) -> Iterator[str]:
+    if rel_dir:
+        local_rules: list[IgnoreRule] = []
+        for name in IGNORE_FILE_NAMES:
+            local_rules += parse_ignore_file(directory / name, rel_dir)
+        if local_rules:
+            rules = rules + local_rules
+
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+
+    for entry in entries:
+        rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name in ALWAYS_PRUNED_DIRS or rel in exclude:
+                continue
+            if is_ignored(rules, rel, is_dir=True):
+                continue
+            yield from _walk_project_dir(Path(entry.path), rel, rules, exclude)
+        elif entry.is_file() and not is_ignored(rules, rel, is_dir=False):
+            yield rel
+
+
+def load_stat_cache(cache_path: Path) -> tuple[dict[str, list[int | str]], list[str] | None]:
+    """Return the cached file entries and the cached ``[stamp, digest]`` of the template."""
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}, None
+    if not isinstance(data, dict) or data.get("version") != STAT_CACHE_VERSION:
+        return {}, None
+    files = data.get("files")
+    template = data.get("template")
+    return (
+        files if isinstance(files, dict) else {},
+        template if isinstance(template, list) and len(template) == 2 else None,
+    )
 
-    return generated_files
 
+def save_stat_cache(
+    cache_path: Path, files: dict[str, list[int | str]], template: list[str] | None
+) -> None:
+    try:
+        payload = {"version": STAT_CACHE_VERSION, "files": files, "template": template}
+        cache_path.write_text(json.dumps(payload, separators=(",", ":")) + "\n", encoding="utf-8")
+    except OSError:
+        pass
 
-def run_status(project_path: Path) -> None:
+
+def template_stamp(templates_dir: Path, template_name: str) -> tuple[str, int]:
+    """Fingerprint a template from file stats alone; also return the newest mtime.
+
+    A pack is stamped by the pack file itself, a directory by every file in it.
+    """
+    pack_path = templates_dir / f"{template_name}{PACK_SUFFIX}"
+    if not (templates_dir / template_name).is_dir() and pack_path.is_file():
+        paths = [pack_path]
+    else:
+        paths = sorted(resolve_template_root(templates_dir, template_name).rglob("*"))
+    stamp = hashlib.sha256(template_name.encode("utf-8"))
+    newest_ns = 0
+    for path in paths:
+        st = path.stat()
+        stamp.update(f"{path}\0{st.st_size}\0{st.st_mtime_ns}\0{st.st_ino}\n".encode())
+        newest_ns = max(newest_ns, st.st_mtime_ns)
+    return stamp.hexdigest(), newest_ns
+
+
+def template_state(
+    manifest: dict[str, object],
+    cached: list[str] | None,
+    cache_dir: Path | None,
+    racy_after_ns: int,
+) -> tuple[str, list[str] | None]:
+    """Compare the manifest's template digest with the template on disk.
+
+    The template is only compiled and hashed when its stamp differs from the
+    ``[stamp, digest]`` pair cached by the previous run. Returns the state and
+    the pair to cache next (None when it must not be cached).
+    """
+    recorded = manifest.get("template_digest")
+    if not recorded:
+        return "unknown (manifest has no template digest)", None
+    templates_dir = default_templates_dir()
+    template_name = str(manifest.get("template"))
+    try:
+        stamp, newest_ns = template_stamp(templates_dir, template_name)
+        if cached is not None and cached[0] == stamp:
+            digest = cached[1]
+        else:
+            entries = compile_template(templates_dir, template_name, cache_dir=cache_dir)
+            digest = template_digest(entries)
+    except FileNotFoundError:
+        return "template not found", None
+    record = [stamp, digest] if newest_ns < racy_after_ns else None
+    if digest == recorded:
+        return "current", record
+    return "outdated (run `update` to apply template changes)", record
+
+
+def run_status(project_path: Path, full: bool = False, cache_dir: Path | None = None) -> None:
     manifest_path = project_path / ".scaffold" / "manifest.json"
     if not manifest_path.exists():
         raise FileNotFoundError(f"Manifest not found: {manifest_path}")
@@ -120,54 +831,294 @@ def run_status(project_path: Path) -> None:
     manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
     files: dict[str, str] = manifest.get("files", {})
 
+    # Hashes are cached per file next to the manifest and reused while the
+    # file's (size, mtime_ns, inode) is unchanged; --full ignores the cache.
+    stat_cache_path = project_path / ".scaffold" / "stat-cache.json"
+    stat_cache, cached_template = ({}, None) if full else load_stat_cache(stat_cache_path)
+    new_stat_cache: dict[str, list[int | str]] = {}
+    racy_after_ns = time.time_ns() - RACY_MTIME_WINDOW_NS
+
     generated: list[str] = []
     modified: list[str] = []
     deleted: list[str] = []
 
     for rel, expected_hash in sorted(files.items()):
         path = project_path / rel
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             deleted.append(rel)
             continue
-        if file_sha256(path) == expected_hash:
+        key: list[int | str] = [st.st_size, st.st_mtime_ns, st.st_ino]
+        cached = stat_cache.get(rel)
+        if cached is not None and cached[:3] == key:
+            digest = str(cached[3])
+        else:
+            digest = file_sha256(path)
+        if st.st_mtime_ns < racy_after_ns:
+            new_stat_cache[rel] = [*key, digest]
+        if digest == expected_hash:
             generated.append(rel)
         else:
             modified.append(rel)
 
-    ignored = {".scaffold/manifest.json"}
+    state, new_template = template_state(manifest, cached_template, cache_dir, racy_after_ns)
+    if new_stat_cache != stat_cache or new_template != cached_template:
+        save_stat_cache(stat_cache_path, new_stat_cache, new_template)
+
     generated_set = set(files.keys())
     custom: list[str] = []
-    for path in sorted(p for p in project_path.rglob("*") if p.is_file()):
-        rel = path.relative_to(project_path).as_posix()
-        if rel in ignored or rel in generated_set:
+    for rel in iter_project_files(project_path, exclude={".scaffold"}):
+        if rel in generated_set:
             continue
         custom.append(rel)
 
     print(f"Template: {manifest.get('template', 'unknown')}")
+    print(f"Template state: {state}")
     print(f"Generated (unchanged): {len(generated)}")
     print(f"Modified generated: {len(modified)}")
     print(f"Deleted generated: {len(deleted)}")
     print(f"Custom files: {len(custom)}")
 
-    def print_section(title: str, items: list[str]) -> None:
-        if not items:
-            return
-        print(f"\n{title}:")
-        for item in items:
-            print(f"- {item}")
-
     print_section("Modified generated files", modified)
     print_section("Deleted generated files", deleted)
     print_section("Custom files", custom)
 
 
+def print_section(title: str, items: list[str]) -> None:
+    if not items:
+        return
+    print(f"\n{title}:")
+    for item in items:
+        print(f"- {item}")
+
+
+def _sync_regions(
+    base: list[str], ours: list[str], theirs: list[str]
+) -> list[tuple[int, int, int, int, int, int]]:
+    """Return regions where base, ours and theirs all agree, plus an end sentinel."""
+    ours_blocks = difflib.SequenceMatcher(None, base, ours, False).get_matching_blocks()
+    theirs_blocks = difflib.SequenceMatcher(None, base, theirs, False).get_matching_blocks()
+    regions: list[tuple[int, int, int, int, int, int]] = []
+    io = it = 0
+    while io < len(ours_blocks) and it < len(theirs_blocks):
+        o_base, o_start, o_len = ours_blocks[io]
+        t_base, t_start, t_len = theirs_blocks[it]
+        start = max(o_base, t_base)
+        end = min(o_base + o_len, t_base + t_len)
+        if start < end:
+            o_sub = o_start + (start - o_base)
+            t_sub = t_start + (start - t_base)
+            regions.append((start, end, o_sub, o_sub + end - start, t_sub, t_sub + end - start))
+        if o_base + o_len < t_base + t_len:
+            io += 1
+        else:
+            it += 1
+    regions.append((len(base), len(base), len(ours), len(ours), len(theirs), len(theirs)))
+    return regions
+
+
+def merge3(base: str, ours: str, theirs: str) -> tuple[str, bool]:
+    """Line-based three-way merge; returns the merged text and whether it conflicts."""
+    base_lines = base.splitlines(keepends=True)
+    our_lines = ours.splitlines(keepends=True)
+    their_lines = theirs.splitlines(keepends=True)
+
+    merged: list[str] = []
+    conflicted = False
+    ib = io = it = 0
+    for b_start, b_end, o_start, o_end, t_start, t_end in _sync_regions(
+        base_lines, our_lines, their_lines
+    ):
+        base_chunk = base_lines[ib:b_start]
+        our_chunk = our_lines[io:o_start]
+        their_chunk = their_lines[it:t_start]
+        if our_chunk == their_chunk or their_chunk == base_chunk:
+            merged += our_chunk
+        elif our_chunk == base_chunk:
+            merged += their_chunk
+        else:
+            conflicted = True
+            merged.append("<<<<<<< yours\n")
+            merged += _terminated(our_chunk)
+            merged.append("=======\n")
+            merged += _terminated(their_chunk)
+            merged.append(">>>>>>> template\n")
+        merged += base_lines[b_start:b_end]
+        ib, io, it = b_end, o_end, t_end
+    return "".join(merged), conflicted
+
+
+def _terminated(lines: list[str]) -> list[str]:
+    if lines and not lines[-1].endswith("\n"):
+        return [*lines[:-1], lines[-1] + "\n"]
+    return lines
+
+
+def _put_rendered(path: Path, data: bytes | None, staged: TemplateSource | None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if data is not None:
+        path.write_bytes(data)
+    elif staged is not None:
+        copy_source(staged, path)
+
+
+def run_update(
+    project_path: Path,
+    extra_vars: dict[str, str] | None = None,
+    dry_run: bool = False,
+    cache_dir: Path | None = None,
+) -> None:
+    """Re-render a project's template and apply the changes to the project.
+
+    Files whose rendered output still matches the manifest hash are skipped
+    without being read. Files the user has not touched are replaced, and
+    modified files are three-way merged against the pristine copy stored in
+    .scaffold/base. Files are processed one at a time.
+    """
+    manifest_path = project_path / ".scaffold" / "manifest.json"
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"Manifest not found: {manifest_path}")
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    saved_context = manifest.get("context")
+    if not isinstance(saved_context, dict):
+        raise ValueError(
+            f"Manifest {manifest_path} has no saved context; "
+            "re-create the project to enable update."
+        )
+    context: dict[str, str] = {**saved_context, **(extra_vars or {})}
+    template_name: str = manifest["template"]
+    old_files: dict[str, str] = manifest.get("files", {})
+
+    entries = compile_template(default_templates_dir(), template_name, cache_dir=cache_dir)
+    check_context(entries, context)
+    digest = template_digest(entries)
+    if digest == manifest.get("template_digest") and context == saved_context:
+        print(f"Template: {template_name}")
+        print("Already up to date.")
+        return
+
+    base_dir = project_path / ".scaffold" / "base"
+    new_files: dict[str, str] = {}
+    unchanged = 0
+    updated: list[str] = []
+    merged: list[str] = []
+    conflicts: list[str] = []
+    added: list[str] = []
+    skipped: list[str] = []
+    removed: list[str] = []
+    orphaned: list[str] = []
+    not_merged: list[str] = []
+
+    for entry in entries:
+        if entry.kind == "dir":
+            continue
+
+        rel = rendered_path(entry, context)
+        base_path = base_dir / rel
+        # Text is rendered in memory; large and binary files are staged on disk
+        # (binary files straight from the template) and copied from there.
+        data: bytes | None = None
+        staged: TemplateSource | None = None
+        if entry.kind == "text":
+            data = render_compiled(entry.segments or [], context).encode("utf-8")
+            new_hash = hashlib.sha256(data).hexdigest()
+        elif entry.kind == "binary":
+            staged = entry.source
+            new_hash = entry.digest
+        elif entry.source is not None and dry_run:
+            # A dry run only needs the hash; staging would write into .scaffold/base.
+            new_hash = stream_sha256(entry.source, context)
+        else:
+            staged = base_path.with_name(f"{base_path.name}.scaffold-new")
+            staged.parent.mkdir(parents=True, exist_ok=True)
+            new_hash = write_entry(entry, context, staged)
+        new_files[rel] = new_hash
+        old_hash = old_files.get(rel)
+
+        target = project_path / rel
+        if new_hash == old_hash:
+            unchanged += 1
+        elif not target.exists():
+            if old_hash is None:
+                if not dry_run:
+                    _put_rendered(target, data, staged)
+                added.append(rel)
+            else:
+                skipped.append(rel)
+        else:
+            current_hash = file_sha256(target)
+            if current_hash == new_hash:
+                updated.append(rel)
+            elif current_hash == old_hash:
+                if not dry_run:
+                    _put_rendered(target, data, staged)
+                updated.append(rel)
+            elif data is None:
+                not_merged.append(rel)
+            else:
+                try:
+                    ours = target.read_text(encoding="utf-8")
+                except UnicodeDecodeError:
+                    # Local edits that are not UTF-8 cannot be merged line by line.
+                    conflicts.append(f"{rel} (not UTF-8, left as is)")
+                else:
+                    base = base_path.read_text(encoding="utf-8") if base_path.exists() else ""
+                    text, conflicted = merge3(base, ours, data.decode("utf-8"))
+                    if not dry_run:
+                        target.write_text(text, encoding="utf-8", newline="")
+                    (conflicts if conflicted else merged).append(rel)
+
+        if new_hash != old_hash and not dry_run:
+            _put_rendered(base_path, data, staged)
+        if entry.kind == "stream" and isinstance(staged, Path):
+            staged.unlink(missing_ok=True)
+
+    for rel, old_hash in sorted(old_files.items()):
+        if rel in new_files:
+            continue
+        target = project_path / rel
+        if target.exists() and file_sha256(target) != old_hash:
+            orphaned.append(rel)
+        else:
+            removed.append(rel)
+            if not dry_run:
+                target.unlink(missing_ok=True)
+        if not dry_run:
+            (base_dir / rel).unlink(missing_ok=True)
+
+    if not dry_run:
+        write_manifest(project_path, template_name, new_files, context, digest)
+
+    print(f"Template: {template_name}{' (dry run)' if dry_run else ''}")
+    print(f"Unchanged in template: {unchanged}")
+    print(f"Updated: {len(updated)}")
+    print(f"Merged: {len(merged)}")
+    print(f"Conflicts: {len(conflicts)}")
+    print(f"Added: {len(added)}")
+    print(f"Removed: {len(removed)}")
+
+    print_section("Updated files", updated)
+    print_section("Merged files", merged)
+    print_section("Conflicting files (resolve the <<<<<<< markers)", conflicts)
+    print_section("Added files", added)
+    print_section("Removed files", removed)
+    print_section("Deleted locally, not restored", skipped)
+    print_section("Removed from template but modified locally, kept", orphaned)
+    print_section(
+        "Binary or large files modified locally, not merged (template version in .scaffold/base)",
+        not_merged,
+    )
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Create Python projects from templates.")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     create = subparsers.add_parser("create", help="Generate a project from a template.")
     create.add_argument("--name", required=True, help="Project name.")
-    create.add_argument("--template", default="fullstack-app", help="Template folder name.")
+    create.add_argument("--template", default=DEFAULT_TEMPLATE, help="Template folder name.")
     create.add_argument(
         "--output",
         default=".",
@@ -177,11 +1128,11 @@ def build_parser() -> argparse.ArgumentParser:
     create.add_argument("--email", default="", help="Author email.")
     create.add_argument(
         "--description",
-        default="Full-stack app with Python backend and Next.js frontend.",
+        default=DEFAULT_DESCRIPTION,
         help="Project description.",
     )
-    create.add_argument("--python", default=">=3.11", help="Python version constraint.")
-    create.add_argument("--license", default="MIT", help="License identifier.")
+    create.add_argument("--python", default=DEFAULT_PYTHON, help="Python version constraint.")
+    create.add_argument("--license", default=DEFAULT_LICENSE, help="License identifier.")
     create.add_argument(
         "--var",
         action="append",
@@ -189,6 +1140,22 @@ def build_parser() -> argparse.ArgumentParser:
         help="Additional template variable in key=value format. Can be repeated.",
     )
     create.add_argument("--overwrite", action="store_true", help="Overwrite existing files.")
+    create.add_argument(
+        "--cache-dir",
+        default=str(default_cache_dir()),
+        help="Directory for compiled template cache.",
+    )
+    create.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the compiled template cache.",
+    )
+    create.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of threads used to render and write files.",
+    )
 
     list_cmd = subparsers.add_parser("list", help="List available templates.")
     list_cmd.add_argument("--templates-dir", default="templates", help="Templates directory path.")
@@ -199,19 +1166,107 @@ def build_parser() -> argparse.ArgumentParser:
         default=".",
         help="Path to a scaffolded project directory (contains .scaffold/manifest.json).",
     )
+    status.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-hash every generated file instead of trusting the stat cache.",
+    )
+    status.add_argument(
+        "--cache-dir",
+        default=str(default_cache_dir()),
+        help="Directory for compiled template cache.",
+    )
+    status.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the compiled template cache.",
+    )
 
-    return parser
+    batch = subparsers.add_parser(
+        "create-batch",
+        help="Generate many projects from a spec file, compiling each template once.",
+    )
+    batch.add_argument(
+        "--spec",
+        required=True,
+        help="Project specs (.jsonl, .json or .yaml). Each entry needs a 'name'.",
+    )
+    batch.add_argument("--template", default=DEFAULT_TEMPLATE, help="Default template folder name.")
+    batch.add_argument(
+        "--output",
+        default=".",
+        help="Default directory where project folders should be created.",
+    )
+    batch.add_argument("--overwrite", action="store_true", help="Overwrite existing files.")
+    batch.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Number of worker processes rendering projects.",
+    )
+    batch.add_argument(
+        "--cache-dir",
+        default=str(default_cache_dir()),
+        help="Directory for compiled template cache.",
+    )
+    batch.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the compiled template cache.",
+    )
 
+    pack = subparsers.add_parser(
+        "pack",
+        help="Pack a template directory into a single indexed archive file.",
+    )
+    pack.add_argument("--template", default=DEFAULT_TEMPLATE, help="Template folder name.")
+    pack.add_argument(
+        "--output",
+        default="",
+        help=f"Archive path (default: templates/<template>{PACK_SUFFIX}).",
+    )
 
-def run_create(args: argparse.Namespace) -> None:
-    root = Path(__file__).resolve().parent
-    templates_dir = root / "templates"
+    update = subparsers.add_parser(
+        "update",
+        help="Re-apply the current template to a project, merging local changes.",
+    )
+    update.add_argument(
+        "--project",
+        default=".",
+        help="Path to a scaffolded project directory (contains .scaffold/manifest.json).",
+    )
+    update.add_argument(
+        "--var",
+        action="append",
+        default=[],
+        help="Override a saved template variable in key=value format. Can be repeated.",
+    )
+    update.add_argument("--dry-run", action="store_true", help="Report changes without writing.")
+    update.add_argument(
+        "--cache-dir",
+        default=str(default_cache_dir()),
+        help="Directory for compiled template cache.",
+    )
+    update.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the compiled template cache.",
+    )
+
+    return parser
 
-    project_slug = slugify(args.name)
-    destination = Path(args.output).resolve() / project_slug
 
-    author = args.author.strip()
-    email = args.email.strip()
+def build_context(
+    name: str,
+    author: str = "",
+    email: str = "",
+    description: str = DEFAULT_DESCRIPTION,
+    python_version: str = DEFAULT_PYTHON,
+    license_id: str = DEFAULT_LICENSE,
+    extra_vars: dict[str, str] | None = None,
+) -> dict[str, str]:
+    author = author.strip()
+    email = email.strip()
     if author and email:
         author_line = f"{author} <{email}>"
     elif author:
@@ -220,45 +1275,267 @@ def run_create(args: argparse.Namespace) -> None:
         author_line = ""
 
     context = {
-        "project_name": args.name.strip(),
-        "project_slug": project_slug,
-        "package_name": to_package_name(args.name),
-        "description": args.description.strip(),
-        "python_version": args.python.strip(),
-        "license": args.license.strip(),
+        "project_name": name.strip(),
+        "project_slug": slugify(name),
+        "package_name": to_package_name(name),
+        "description": description.strip(),
+        "python_version": python_version.strip(),
+        "license": license_id.strip(),
         "author": author,
         "email": email,
         "author_line": author_line,
         "year": str(dt.datetime.now().year),
     }
+    context.update(extra_vars or {})
+    return context
 
-    context.update(parse_vars(args.var))
+
+def create_project(
+    entries: list[TemplateEntry],
+    digest: str,
+    template_name: str,
+    destination: Path,
+    context: dict[str, str],
+    overwrite: bool = False,
+    jobs: int = 1,
+) -> None:
     generated_files = scaffold_project(
-        templates_dir=templates_dir,
+        templates_dir=default_templates_dir(),
+        template_name=template_name,
+        destination=destination,
+        context=context,
+        overwrite=overwrite,
+        jobs=jobs,
+        entries=entries,
+    )
+    write_manifest(
+        destination=destination,
+        template_name=template_name,
+        files=generated_files,
+        context=context,
+        template_digest=digest,
+    )
+
+
+def run_create(args: argparse.Namespace) -> None:
+    cache_dir = None if args.no_cache else Path(args.cache_dir).expanduser()
+    destination = Path(args.output).resolve() / slugify(args.name)
+
+    if args.jobs < 1:
+        raise ValueError("--jobs must be at least 1.")
+
+    context = build_context(
+        name=args.name,
+        author=args.author,
+        email=args.email,
+        description=args.description,
+        python_version=args.python,
+        license_id=args.license,
+        extra_vars=parse_vars(args.var),
+    )
+    entries = compile_template(default_templates_dir(), args.template, cache_dir=cache_dir)
+    create_project(
+        entries=entries,
+        digest=template_digest(entries),
         template_name=args.template,
         destination=destination,
         context=context,
         overwrite=args.overwrite,
+        jobs=args.jobs,
     )
-    write_manifest(destination=destination, template_name=args.template, files=generated_files)
     print(f"Project created at: {destination}")
     print(f"Manifest written to: {destination / '.scaffold' / 'manifest.json'}")
 
 
+@dataclass
+class BatchResult:
+    name: str
+    destination: str
+    seconds: float
+    error: str | None = None
+
+
+BATCH_SPEC_KEYS = {
+    "name",
+    "template",
+    "output",
+    "author",
+    "email",
+    "description",
+    "python",
+    "license",
+    "vars",
+    "overwrite",
+}
+
+# Compiled templates (entries, digest) keyed by name, or the compile error.
+# Set once per process so pool workers do not receive them with every task.
+_batch_templates: dict[str, tuple[list[TemplateEntry], str] | Exception] = {}
+
+
+def load_batch_spec(spec_path: Path) -> list[dict[str, Any]]:
+    """Load project specs from a .jsonl, .json or .yaml/.yml file."""
+    text = spec_path.read_text(encoding="utf-8")
+    suffix = spec_path.suffix.lower()
+    data: Any
+    if suffix == ".jsonl":
+        data = [json.loads(line) for line in text.splitlines() if line.strip()]
+    elif suffix == ".json":
+        data = json.loads(text)
+    elif suffix in {".yaml", ".yml"}:
+        if yaml is None:
+            raise RuntimeError("PyYAML is required for YAML specs. Install pyyaml or use JSONL.")
+        data = yaml.safe_load(text)
+    else:
+        raise ValueError(
+            f"Unsupported spec format '{spec_path.suffix}'. Use .jsonl, .json or .yaml."
+        )
+
+    if isinstance(data, dict):
+        data = data.get("projects")
+    if not isinstance(data, list):
+        raise ValueError(f"Spec {spec_path} must contain a list of projects.")
+    for index, spec in enumerate(data, start=1):
+        if not isinstance(spec, dict) or not spec.get("name"):
+            raise ValueError(f"Spec entry {index} in {spec_path} must be a mapping with a 'name'.")
+        unknown = sorted(set(spec) - BATCH_SPEC_KEYS)
+        if unknown:
+            raise ValueError(f"Spec entry {index} has unknown keys: {', '.join(unknown)}")
+        if spec.get("vars") is not None and not isinstance(spec["vars"], dict):
+            raise ValueError(f"Spec entry {index} in {spec_path}: 'vars' must be a mapping.")
+    return data
+
+
+def _init_batch_worker(templates: dict[str, tuple[list[TemplateEntry], str] | Exception]) -> None:
+    global _batch_templates
+    _batch_templates = templates
+
+
+def _batch_destination(spec: dict[str, Any], defaults: dict[str, Any]) -> Path:
+    output = spec.get("output", defaults["output"])
+    return Path(str(output)).resolve() / slugify(str(spec["name"]))
+
+
+def _create_from_spec(spec: dict[str, Any], defaults: dict[str, Any]) -> BatchResult:
+    started = time.perf_counter()
+    name = str(spec["name"])
+    options = {**defaults, **spec}
+    destination = _batch_destination(spec, defaults)
+    try:
+        compiled = _batch_templates[str(options["template"])]
+        if isinstance(compiled, Exception):
+            raise compiled
+        entries, digest = compiled
+        context = build_context(
+            name=name,
+            author=str(options.get("author", "")),
+            email=str(options.get("email", "")),
+            description=str(options.get("description", DEFAULT_DESCRIPTION)),
+            python_version=str(options.get("python", DEFAULT_PYTHON)),
+            license_id=str(options.get("license", DEFAULT_LICENSE)),
+            extra_vars={str(k): str(v) for k, v in (options.get("vars") or {}).items()},
+        )
+        create_project(
+            entries=entries,
+            digest=digest,
+            template_name=str(options["template"]),
+            destination=destination,
+            context=context,
+            overwrite=bool(options.get("overwrite", False)),
+        )
+    except Exception as exc:  # Report and keep going with the rest of the batch.
+        error = f"{type(exc).__name__}: {exc}"
+        return BatchResult(name, str(destination), time.perf_counter() - started, error)
+    return BatchResult(name, str(destination), time.perf_counter() - started)
+
+
+def run_create_batch(args: argparse.Namespace) -> None:
+    if args.processes < 1:
+        raise ValueError("--processes must be at least 1.")
+
+    specs = load_batch_spec(Path(args.spec).resolve())
+    cache_dir = None if args.no_cache else Path(args.cache_dir).expanduser()
+    defaults: dict[str, Any] = {
+        "template": args.template,
+        "output": args.output,
+        "overwrite": args.overwrite,
+    }
+
+    templates: dict[str, tuple[list[TemplateEntry], str] | Exception] = {}
+    for name in sorted({str(spec.get("template", args.template)) for spec in specs}):
+        try:
+            entries = compile_template(default_templates_dir(), name, cache_dir=cache_dir)
+        except (OSError, ValueError, KeyError) as exc:  # Missing, unreadable or corrupt.
+            templates[name] = exc
+        else:
+            templates[name] = (entries, template_digest(entries))
+
+    # A spec whose destination an earlier spec already claimed fails up front;
+    # in the pool both would otherwise write into the same directory at once.
+    claimed: dict[str, str] = {}
+    duplicates: dict[int, BatchResult] = {}
+    pending: list[dict[str, Any]] = []
+    for index, spec in enumerate(specs):
+        destination = _batch_destination(spec, defaults)
+        key = os.path.normcase(str(destination))
+        if key in claimed:
+            error = f"Destination is also used by '{claimed[key]}' earlier in this batch."
+            duplicates[index] = BatchResult(str(spec["name"]), str(destination), 0.0, error)
+        else:
+            claimed[key] = str(spec["name"])
+            pending.append(spec)
+
+    started = time.perf_counter()
+    if args.processes > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(
+            max_workers=args.processes,
+            initializer=_init_batch_worker,
+            initargs=(templates,),
+        ) as pool:
+            created = list(pool.map(_create_from_spec, pending, [defaults] * len(pending)))
+    else:
+        _init_batch_worker(templates)
+        created = [_create_from_spec(spec, defaults) for spec in pending]
+    elapsed = time.perf_counter() - started
+    created_iter = iter(created)
+    results = [duplicates.get(index) or next(created_iter) for index in range(len(specs))]
+
+    failures = [result for result in results if result.error]
+    for result in results:
+        status = "FAIL" if result.error else "ok"
+        print(f"{status:<4} {result.seconds * 1000:8.1f} ms  {result.name} -> {result.destination}")
+        if result.error:
+            print(f"     {result.error}")
+    print(
+        f"\nCreated {len(results) - len(failures)}/{len(results)} projects in {elapsed:.2f}s"
+        f" ({len(failures)} failed)."
+    )
+    if failures:
+        sys.exit(1)
+
+
 def run_list(args: argparse.Namespace) -> None:
     root = Path(__file__).resolve().parent
     templates_dir = (root / args.templates_dir).resolve()
     if not templates_dir.exists():
         raise FileNotFoundError(f"Templates directory not found: {templates_dir}")
 
-    templates = sorted(p.name for p in templates_dir.iterdir() if p.is_dir())
+    templates = list_templates(templates_dir)
     if not templates:
         print("No templates found.")
         return
 
     print("Available templates:")
     for template in templates:
-        print(f"- {template}")
+        packed = not (templates_dir / template).is_dir()
+        print(f"- {template}{' (pack)' if packed else ''}")
+
+
+def run_pack(args: argparse.Namespace) -> None:
+    templates_dir = default_templates_dir()
+    output = Path(args.output) if args.output else templates_dir / f"{args.template}{PACK_SUFFIX}"
+    count = pack_template(templates_dir, args.template, output.resolve())
+    print(f"Packed {count} files from '{args.template}' into: {output.resolve()}")
 
 
 def main() -> None:
@@ -267,10 +1544,25 @@ def main() -> None:
 
     if args.command == "create":
         run_create(args)
+    elif args.command == "create-batch":
+        run_create_batch(args)
     elif args.command == "list":
         run_list(args)
     elif args.command == "status":
-        run_status(Path(args.project).resolve())
+        run_status(
+            Path(args.project).resolve(),
+            full=args.full,
+            cache_dir=None if args.no_cache else Path(args.cache_dir).expanduser(),
+        )
+    elif args.command == "pack":
+        run_pack(args)
+    elif args.command == "update":
+        run_update(
+            Path(args.project).resolve(),
+            extra_vars=parse_vars(args.var),
+            dry_run=args.dry_run,
+            cache_dir=None if args.no_cache else Path(args.cache_dir).expanduser(),
+        )
 
 
 if __name__ == "__main__":
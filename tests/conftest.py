@@ -0,0 +1,35 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+import scaffold
+
+MakeTemplate = Callable[[dict[str, str | bytes]], Path]
+
+
+@pytest.fixture
+def templates_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """An empty templates directory that scaffold.default_templates_dir() points at."""
+    path = tmp_path / "templates"
+    path.mkdir()
+    monkeypatch.setattr(scaffold, "default_templates_dir", lambda: path)
+    return path
+
+
+@pytest.fixture
+def make_template(templates_dir: Path) -> MakeTemplate:
+    """Write a template named "demo" from {relative path: text or bytes}."""
+
+    def make(files: dict[str, str | bytes]) -> Path:
+        root = templates_dir / "demo"
+        for relative, content in files.items():
+            path = root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if isinstance(content, bytes):
+                path.write_bytes(content)
+            else:
+                path.write_text(content, encoding="utf-8")
+        return root
+
+    return make
@@ -0,0 +1,57 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from scaffold import build_parser, load_batch_spec, run_create_batch
+
+
+def _write_spec(tmp_path: Path, specs: list[dict[str, object]]) -> Path:
+    spec_path = tmp_path / "projects.jsonl"
+    spec_path.write_text("".join(json.dumps(spec) + "\n" for spec in specs), encoding="utf-8")
+    return spec_path
+
+
+def test_vars_must_be_a_mapping(tmp_path: Path) -> None:
+    spec_path = _write_spec(tmp_path, [{"name": "a"}, {"name": "b", "vars": ["x=1"]}])
+
+    with pytest.raises(ValueError, match="Spec entry 2 .*'vars' must be a mapping"):
+        load_batch_spec(spec_path)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_bad_entry_does_not_stop_the_batch(
+    templates_dir: Path,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    processes: int,
+) -> None:
+    (templates_dir / "demo").mkdir()
+    (templates_dir / "demo" / "README.md.tmpl").write_text("{{ project_name }}", encoding="utf-8")
+    spec_path = _write_spec(
+        tmp_path,
+        [{"name": "First"}, {"name": "Missing", "template": "nope"}, {"name": "Last"}],
+    )
+    output = tmp_path / "out"
+    args = build_parser().parse_args(
+        [
+            "create-batch",
+            "--spec",
+            str(spec_path),
+            "--template",
+            "demo",
+            "--output",
+            str(output),
+            "--processes",
+            str(processes),
+            "--no-cache",
+        ]
+    )
+
+    with pytest.raises(SystemExit):
+        run_create_batch(args)
+
+    assert (output / "first" / "README.md").read_text(encoding="utf-8") == "First"
+    assert (output / "last" / "README.md").read_text(encoding="utf-8") == "Last"
+    assert not (output / "missing").exists()
+    assert "FileNotFoundError: Template 'nope' not found" in capsys.readouterr().out
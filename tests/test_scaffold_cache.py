@@ -0,0 +1,104 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+from conftest import MakeTemplate
+
+from scaffold import (
+    RACY_MTIME_WINDOW_NS,
+    build_context,
+    compile_template,
+    create_project,
+    render_compiled,
+    run_status,
+    template_digest,
+)
+
+
+def test_compile_cache_is_keyed_by_template_content(
+    templates_dir: Path, make_template: MakeTemplate, tmp_path: Path
+) -> None:
+    cache_dir = tmp_path / "cache"
+    root = make_template({"README.md.tmpl": "old {{ project_name }}"})
+    context = build_context("Demo")
+
+    first = compile_template(templates_dir, "demo", cache_dir=cache_dir)
+    (root / "README.md.tmpl").write_text("new {{ project_name }}", encoding="utf-8")
+    second = compile_template(templates_dir, "demo", cache_dir=cache_dir)
+
+    assert render_compiled(first[0].segments or [], context) == "old Demo"
+    assert render_compiled(second[0].segments or [], context) == "new Demo"
+    cached = json.loads((cache_dir / "demo.json").read_text(encoding="utf-8"))["files"]
+    assert list(cached) == [second[0].digest]
+
+
+def test_compile_cache_hit_skips_parsing(
+    templates_dir: Path, make_template: MakeTemplate, tmp_path: Path
+) -> None:
+    cache_dir = tmp_path / "cache"
+    make_template({"README.md.tmpl": "hello {{ project_name }}"})
+    entries = compile_template(templates_dir, "demo", cache_dir=cache_dir)
+    # Tamper with the cached body: a hit must come from the cache, not a re-parse.
+    cache_path = cache_dir / "demo.json"
+    data = json.loads(cache_path.read_text(encoding="utf-8"))
+    data["files"][entries[0].digest] = ["cached"]
+    cache_path.write_text(json.dumps(data), encoding="utf-8")
+
+    assert compile_template(templates_dir, "demo", cache_dir=cache_dir)[0].segments == ["cached"]
+    assert compile_template(templates_dir, "demo")[0].segments != ["cached"]
+
+
+def _create(templates_dir: Path, destination: Path) -> None:
+    entries = compile_template(templates_dir, "demo")
+    create_project(entries, template_digest(entries), "demo", destination, build_context("Demo"))
+
+
+def _age(path: Path) -> None:
+    """Move a file's mtime out of the racy window so its hash may be cached."""
+    old = path.stat().st_mtime_ns - 10 * RACY_MTIME_WINDOW_NS
+    os.utime(path, ns=(old, old))
+
+
+def _cached_files(destination: Path) -> dict[str, object]:
+    stat_cache = destination / ".scaffold" / "stat-cache.json"
+    files: dict[str, object] = json.loads(stat_cache.read_text(encoding="utf-8"))["files"]
+    return files
+
+
+def test_status_trusts_stat_cache_unless_full(
+    templates_dir: Path,
+    make_template: MakeTemplate,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    make_template({"a.txt": "aaaa"})
+    destination = tmp_path / "out"
+    _create(templates_dir, destination)
+    target = destination / "a.txt"
+    _age(target)
+    run_status(destination)
+    assert "a.txt" in _cached_files(destination)
+
+    # Same size, mtime and inode: only a full check notices the new content.
+    stamp = target.stat().st_mtime_ns
+    target.write_text("bbbb", encoding="utf-8")
+    os.utime(target, ns=(stamp, stamp))
+    capsys.readouterr()
+    run_status(destination)
+    assert "Modified generated: 0" in capsys.readouterr().out
+    run_status(destination, full=True)
+    assert "Modified generated: 1" in capsys.readouterr().out
+
+
+def test_status_does_not_cache_recently_modified_files(
+    templates_dir: Path, make_template: MakeTemplate, tmp_path: Path
+) -> None:
+    make_template({"a.txt": "a", "b.txt": "b"})
+    destination = tmp_path / "out"
+    _create(templates_dir, destination)
+    _age(destination / "a.txt")
+
+    run_status(destination)
+
+    assert sorted(_cached_files(destination)) == ["a.txt"]
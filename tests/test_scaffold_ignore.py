@@ -0,0 +1,103 @@
+from pathlib import Path
+
+from scaffold import IgnoreRule, is_ignored, iter_project_files, parse_ignore_file
+
+
+def _rules(
+    tmp_path: Path, text: str, base: str = "", root_anchored: bool = False
+) -> list[IgnoreRule]:
+    path = tmp_path / "ignore"
+    path.write_text(text, encoding="utf-8")
+    return parse_ignore_file(path, base, root_anchored=root_anchored)
+
+
+def _tree(root: Path, files: dict[str, str]) -> None:
+    for relative, content in files.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+def test_unanchored_pattern_matches_at_any_depth(tmp_path: Path) -> None:
+    rules = _rules(tmp_path, "*.log\n")
+    assert is_ignored(rules, "app.log", is_dir=False)
+    assert is_ignored(rules, "logs/deep/app.log", is_dir=False)
+    assert not is_ignored(rules, "app.log.txt", is_dir=False)
+
+
+def test_anchored_pattern_matches_only_from_base(tmp_path: Path) -> None:
+    rules = _rules(tmp_path, "/build\ndocs/out\n")
+    assert is_ignored(rules, "build", is_dir=True)
+    assert not is_ignored(rules, "src/build", is_dir=True)
+    assert is_ignored(rules, "docs/out", is_dir=True)
+    assert not is_ignored(rules, "src/docs/out", is_dir=True)
+
+
+def test_double_star(tmp_path: Path) -> None:
+    rules = _rules(tmp_path, "**/cache\nvendor/**\na/**/b\n")
+    assert is_ignored(rules, "cache", is_dir=True)
+    assert is_ignored(rules, "x/y/cache", is_dir=True)
+    assert is_ignored(rules, "vendor/lib/x.py", is_dir=False)
+    assert is_ignored(rules, "a/b", is_dir=False)
+    assert is_ignored(rules, "a/x/y/b", is_dir=False)
+    assert not is_ignored(rules, "z/a/b", is_dir=False)
+
+
+def test_negation_re_includes_later_matches(tmp_path: Path) -> None:
+    rules = _rules(tmp_path, "*.env\n!example.env\n")
+    assert is_ignored(rules, "prod.env", is_dir=False)
+    assert not is_ignored(rules, "example.env", is_dir=False)
+
+
+def test_directory_only_rule_skips_files(tmp_path: Path) -> None:
+    rules = _rules(tmp_path, "tmp/\n")
+    assert is_ignored(rules, "tmp", is_dir=True)
+    assert not is_ignored(rules, "tmp", is_dir=False)
+
+
+def test_root_anchored_rules_do_not_match_nested_names(tmp_path: Path) -> None:
+    rules = _rules(tmp_path, "node_modules\n*.pyc\n", root_anchored=True)
+    assert is_ignored(rules, "node_modules", is_dir=True)
+    assert not is_ignored(rules, "web/node_modules", is_dir=True)
+    assert is_ignored(rules, "x.pyc", is_dir=False)
+    assert not is_ignored(rules, "pkg/x.pyc", is_dir=False)
+
+
+def test_walk_applies_nested_gitignore_to_its_directory_only(tmp_path: Path) -> None:
+    _tree(
+        tmp_path,
+        {
+            ".gitignore": "node_modules/\n",
+            "keep.txt": "",
+            "node_modules/lib.js": "",
+            "web/.gitignore": "*.map\n",
+            "web/app.js": "",
+            "web/app.js.map": "",
+            "web/node_modules/lib.js": "",
+            "other/app.js.map": "",
+        },
+    )
+    assert sorted(iter_project_files(tmp_path)) == [
+        ".gitignore",
+        "keep.txt",
+        "other/app.js.map",
+        "web/.gitignore",
+        "web/app.js",
+    ]
+
+
+def test_walk_reads_dockerignore_at_root_with_anchored_patterns(tmp_path: Path) -> None:
+    _tree(
+        tmp_path,
+        {
+            ".dockerignore": "dist\n",
+            "dist/bundle.js": "",
+            "web/dist/bundle.js": "",
+            "web/.dockerignore": "*\n",
+        },
+    )
+    assert sorted(iter_project_files(tmp_path)) == [
+        ".dockerignore",
+        "web/.dockerignore",
+        "web/dist/bundle.js",
+    ]
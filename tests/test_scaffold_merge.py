@@ -0,0 +1,38 @@
+from scaffold import merge3
+
+BASE = "a\nb\nc\n"
+
+
+def test_clean_merge_takes_both_sides() -> None:
+    text, conflicted = merge3(BASE, "A\nb\nc\n", "a\nb\nC\n")
+
+    assert not conflicted
+    assert text == "A\nb\nC\n"
+
+
+def test_overlapping_changes_conflict() -> None:
+    text, conflicted = merge3(BASE, "a\nours\nc\n", "a\ntheirs\nc\n")
+
+    assert conflicted
+    assert text == "a\n<<<<<<< yours\nours\n=======\ntheirs\n>>>>>>> template\nc\n"
+
+
+def test_added_and_deleted_lines_merge() -> None:
+    text, conflicted = merge3(BASE, "a\nb\nc\nd\n", "b\nc\n")
+
+    assert not conflicted
+    assert text == "b\nc\nd\n"
+
+
+def test_identical_change_is_not_a_conflict() -> None:
+    text, conflicted = merge3(BASE, "a\nB\nc\n", "a\nB\nc\n")
+
+    assert not conflicted
+    assert text == "a\nB\nc\n"
+
+
+def test_unterminated_last_line_in_conflict_is_terminated() -> None:
+    text, conflicted = merge3("x", "y", "z")
+
+    assert conflicted
+    assert text == "<<<<<<< yours\ny\n=======\nz\n>>>>>>> template\n"
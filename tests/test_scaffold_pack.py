@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import pytest
+from conftest import MakeTemplate
+
+import scaffold
+from scaffold import build_context, compile_template, pack_template, scaffold_project
+
+FILES: dict[str, str | bytes] = {
+    "README.md.tmpl": "# {{ project_name }}\n",
+    "src/{{ package_name }}/__init__.py.tmpl": '"""{{ description }}"""\n',
+    "assets/logo.bin": bytes(range(256)),
+}
+
+
+def _packed_templates(
+    templates_dir: Path, make_template: MakeTemplate, tmp_path: Path
+) -> Path:
+    """Pack the demo template into a separate templates directory and return it."""
+    make_template(FILES)
+    packed_dir = tmp_path / "packed"
+    packed_dir.mkdir()
+    pack_template(templates_dir, "demo", packed_dir / f"demo{scaffold.PACK_SUFFIX}")
+    return packed_dir
+
+
+def test_pack_round_trip_matches_directory_template(
+    templates_dir: Path, make_template: MakeTemplate, tmp_path: Path
+) -> None:
+    packed_dir = _packed_templates(templates_dir, make_template, tmp_path)
+    context = build_context("Demo App", description="A demo.")
+
+    from_dir = scaffold_project(templates_dir, "demo", tmp_path / "from-dir", context)
+    from_pack = scaffold_project(packed_dir, "demo", tmp_path / "from-pack", context)
+
+    assert from_pack == from_dir
+    for rel in from_dir:
+        assert (tmp_path / "from-pack" / rel).read_bytes() == (
+            tmp_path / "from-dir" / rel
+        ).read_bytes()
+
+
+def test_truncated_pack_is_rejected(
+    templates_dir: Path, make_template: MakeTemplate, tmp_path: Path
+) -> None:
+    packed_dir = _packed_templates(templates_dir, make_template, tmp_path)
+    pack_path = packed_dir / f"demo{scaffold.PACK_SUFFIX}"
+    pack_path.write_bytes(pack_path.read_bytes()[:-10])
+
+    with pytest.raises(ValueError, match="truncated"):
+        compile_template(packed_dir, "demo")
@@ -0,0 +1,76 @@
+import hashlib
+from pathlib import Path
+
+import pytest
+from conftest import MakeTemplate
+
+import scaffold
+from scaffold import (
+    build_context,
+    iter_stream_segments,
+    render_compiled,
+    render_text,
+    scaffold_project,
+)
+
+TEXT = "a{{ name }}b {{name}}\n{{  other }}{ {{x}}}"
+CONTEXT = {"name": "NAME", "other": "OTHER", "x": "X"}
+
+
+def test_entries_rendering_to_the_same_path_are_rejected(
+    templates_dir: Path, make_template: MakeTemplate, tmp_path: Path
+) -> None:
+    make_template({"a.tmpl": "from template", "a": "plain"})
+    destination = tmp_path / "out"
+
+    with pytest.raises(ValueError, match="both render to a"):
+        scaffold_project(templates_dir, "demo", destination, build_context("Demo"), jobs=4)
+    assert not (destination / "a").exists()
+
+
+def _render_chunks(chunks: list[str]) -> str:
+    return "".join(render_compiled(s, CONTEXT) for s in iter_stream_segments(chunks))
+
+
+def test_stream_segments_match_in_memory_render_at_every_split() -> None:
+    expected = render_text(TEXT, CONTEXT)
+    for cut in range(len(TEXT) + 1):
+        assert _render_chunks([TEXT[:cut], TEXT[cut:]]) == expected, cut
+    for first in range(len(TEXT) + 1):
+        for second in range(first, len(TEXT) + 1):
+            chunks = [TEXT[:first], TEXT[first:second], TEXT[second:]]
+            assert _render_chunks(chunks) == expected, (first, second)
+
+
+def test_stream_entries_render_like_text_entries(
+    templates_dir: Path,
+    make_template: MakeTemplate,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    body = "# {{ project_name }}\r\n" * 50
+    make_template({"big.txt.tmpl": body})
+    monkeypatch.setattr(scaffold, "STREAM_THRESHOLD_BYTES", 16)
+    monkeypatch.setattr(scaffold, "HASH_CHUNK_SIZE", 7)
+    destination = tmp_path / "out"
+
+    files = scaffold_project(templates_dir, "demo", destination, build_context("Demo"))
+
+    rendered = (destination / "big.txt").read_bytes()
+    assert rendered == ("# Demo\r\n" * 50).encode()
+    assert (destination / ".scaffold" / "base" / "big.txt").read_bytes() == rendered
+    assert files["big.txt"] == hashlib.sha256(rendered).hexdigest()
+
+
+def test_binary_files_are_copied_byte_for_byte(
+    templates_dir: Path, make_template: MakeTemplate, tmp_path: Path
+) -> None:
+    payload = bytes(range(256)) + b"{{ project_name }}\xff\xfe"
+    make_template({"logo.bin": payload, "README.md.tmpl": "{{ project_name }}\r\n"})
+    destination = tmp_path / "out"
+
+    scaffold_project(templates_dir, "demo", destination, build_context("Demo"))
+
+    assert (destination / "logo.bin").read_bytes() == payload
+    # Line endings are kept as in the template.
+    assert (destination / "README.md").read_bytes() == b"Demo\r\n"